@@ -91,7 +91,7 @@ def setupAi(player: dict, population: int = 15) -> NEAT:
         - neat - NEAT
     """
     file = f"{MODELS_DIR}{player['type']}_{player['difficulty']}"
-    if os.path.isfile(file + '.neat') and not overwrite:
+    if (os.path.isfile(file + '.neat') or os.path.isfile(file + '.neatlog')) and not overwrite:
         neat = NEAT.load(file)
     else:
         neat = NEAT(ENVIRONMENT_DIR, file_name=f"{player['type']}_{player['difficulty']}")
@@ -130,55 +130,103 @@ def neatMove(genome: Genome, args: Any = None) -> tuple:
     :return:
         - move - tuple[int, int]
     """
+    inputs, context = neatInputs(genome.inputs, args)
+    return neatChoice(genome.forwardBatch(inputs) if inputs else [], context)
+
+
+def bestMove(genome: Genome, args: Any = None) -> tuple:
+    """
+    Calculates the best move for a best genome, using its compiled forward
+    since it is played far more often than it changes.
+    :param genome: Genome
+    :param args: Any
+    :return:
+        - move - tuple[int, int]
+    """
+    inputs, context = neatInputs(genome.inputs, args)
+    forward = genome.getCompiled()
+    return neatChoice([forward(row) for row in inputs], context)
+
+
+def neatInputs(genome_inputs: int, args: Any = None) -> tuple:
+    """
+    Builds the inputs of every possible move based on AI difficulty, so they
+    are scored in one batch.
+    :param genome_inputs: int
+    :param args: Any
+    :return:
+        - inputs, context - tuple[list[list[float]], tuple[list[tuple], list[tuple] | None]]
+    """
     c4, difficulty = args[0], args[1]
     player_ids = [c4.current_player, c4.opponent]
-    possible_moves = {}
+    possible_moves = []
     for i in range(c4.COLUMNS):
         possible_move = c4.getPossibleMove(i)
         if possible_move[0] != c4.INVALID_MOVE:
-            possible_moves[possible_move] = 0
+            possible_moves.append(possible_move)
 
-    if genome.inputs == NEAT_INPUTS[difficulty[2]]:
+    if genome_inputs == NEAT_INPUTS[difficulty[2]]:
         inputs = []
         for row in range(c4.ROWS):
             for piece in c4.board[row]:
                 piece = 0 if piece == c4.current_player else 1 if piece == c4.opponent else piece
                 inputs.append(piece)
-        outputs = genome.forward(ml.list.normalize(inputs))
-        for column in range(len(outputs)):
-            for possible_move in possible_moves:
-                if possible_move[1] == column:
-                    possible_moves[possible_move] = outputs[column]
+        return [ml.list.normalize(inputs)], (possible_moves, None)
 
     input_range = {'max': max(c4.ROWS, c4.COLUMNS), 'min': 0}
+    inputs, input_moves = [], []
     for possible_move in possible_moves:
-        if genome.inputs == NEAT_INPUTS[difficulty[0]]:
-            inputs = {}
-            directions = c4.getDirectionalSlices(possible_move)
-            for player_key in player_ids:
-                connection_counts = c4.getConnectionCounts(directions, player_key, immediate_only=False)
-                for direction_pair in directions:
-                    if direction_pair not in inputs:
-                        inputs[direction_pair] = []
-                    connection = sum(connection_counts[direction_pair]) + 1
-                    normalized_input = (connection - input_range['min']) / (input_range['max'] - input_range['min'])
-                    inputs[direction_pair].append(normalized_input)
-            for direction_pair in inputs:
-                possible_moves[possible_move] += sum(genome.forward(inputs[direction_pair]))
-        elif genome.inputs == NEAT_INPUTS[difficulty[1]]:
-            inputs = []
-            directions = c4.getDirectionalSlices(possible_move)
-            for player_key in player_ids:
-                connection_counts = c4.getConnectionCounts(directions, player_key, immediate_only=False)
-                for direction_pair in directions:
-                    connection = sum(connection_counts[direction_pair]) + 1
-                    normalized_input = (connection - input_range['min']) / (input_range['max'] - input_range['min'])
-                    inputs.append(normalized_input)
-            possible_moves[possible_move] += sum(genome.forward(inputs))
+        directions = c4.getDirectionalSlices(possible_move)
+        normalized_inputs = {}
+        for player_key in player_ids:
+            connection_counts = c4.getConnectionCounts(directions, player_key, immediate_only=False)
+            for direction_pair in directions:
+                if direction_pair not in normalized_inputs:
+                    normalized_inputs[direction_pair] = []
+                connection = sum(connection_counts[direction_pair]) + 1
+                normalized_input = (connection - input_range['min']) / (input_range['max'] - input_range['min'])
+                normalized_inputs[direction_pair].append(normalized_input)
+
+        if genome_inputs == NEAT_INPUTS[difficulty[0]]:
+            for direction_pair in normalized_inputs:
+                inputs.append(normalized_inputs[direction_pair])
+                input_moves.append(possible_move)
+        elif genome_inputs == NEAT_INPUTS[difficulty[1]]:
+            inputs.append([normalized_inputs[direction_pair][i] for i in range(len(player_ids))
+                           for direction_pair in normalized_inputs])
+            input_moves.append(possible_move)
+    return inputs, (possible_moves, input_moves)
+
+
+def neatChoice(outputs: Any, context: tuple) -> tuple:
+    """
+    Chooses the best move by scoring the possible moves with the outputs of
+    the inputs built by neatInputs.
+    :param outputs: list[list[float]] | ndarray
+    :param context: tuple[list[tuple], list[tuple] | None]
+    :return:
+        - move - tuple[int, int]
+    """
+    possible_moves = {possible_move: 0 for possible_move in context[0]}
+    if context[1] is None:
+        for possible_move in possible_moves:
+            possible_moves[possible_move] = outputs[0][possible_move[1]]
+    else:
+        for possible_move, output in zip(context[1], outputs):
+            possible_moves[possible_move] += sum(output)
+    return random.choice(getBestMoves(possible_moves))
+
 
+def getBestMoves(possible_moves: dict) -> list:
+    """
+    Gets the possible moves with the highest score.
+    :param possible_moves: dict[tuple[int, int]: int | float]
+    :return:
+        - best_moves - list[tuple[int, int]]
+    """
     sorted_moves = ml.dict.combineByValues(possible_moves)
     max_min_keys = ml.list.findMaxMin(list(sorted_moves.keys()))
-    return random.choice(sorted_moves[max_min_keys['max']['value']])
+    return sorted_moves[max_min_keys['max']['value']]
 
 
 def checkBest(player_key: int, total_matches: int = 80, success_rate: float = 0.2) -> None:
@@ -204,7 +252,7 @@ def checkBest(player_key: int, total_matches: int = 80, success_rate: float = 0.
         while c4.match:
             current_player = players[c4.current_player]
             best_genome = current_player['neat'].best_specie.representative
-            possible_move = neatMove(best_genome, (c4, DIFFICULTY))
+            possible_move = bestMove(best_genome, (c4, DIFFICULTY))
             result = c4.main(possible_move)
             if result == c4.WIN:
                 if c4.current_player == player_key:
@@ -242,6 +290,9 @@ def close() -> None:
     """
     pg.quit()
     print(f"Cleaning processes...")
+    for player in players:
+        if player['neat'] is not None:
+            player['neat'].close()
     time.sleep(3)
     sys.exit('Thanks for using NEAT with Connect 4')
 
@@ -559,13 +610,16 @@ def main() -> None:
                             if show_every == SHOW_EVERY[0]:
                                 player['neat'].nextGenome()
                             elif show_every == SHOW_EVERY[1]:
-                                results = player['neat'].parallelTest(neatMove, connect4, DIFFICULTY)
+                                results = player['neat'].populationTest(neatInputs, neatChoice, connect4, DIFFICULTY)
                                 player['neat'].parallelEvolve(connect4.fitnessEvaluation(), results)
                         else:
                             return
                         checkBest(current_player)
 
-                    move = neatMove(current_genome, (connect4, DIFFICULTY))
+                    if player['type'] == PLAYER_TYPES[1]:
+                        move = bestMove(current_genome, (connect4, DIFFICULTY))
+                    else:
+                        move = neatMove(current_genome, (connect4, DIFFICULTY))
 
                     if display:
                         network.generate(current_genome)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 import json
 import logging
 import os
 import pickle
+import threading
 
-__version__ = '1.2.3'
-__date__ = '21/04/2022'
+__version__ = '1.3.0'
+__date__ = '17/10/2026'
 
 
 def read(file_dir: str = '') -> Any | None:
@@ -34,10 +36,34 @@ def read(file_dir: str = '') -> Any | None:
         logging.exception(e)
 
 
+@contextmanager
+def atomic(file_dir: str, mode: str = 'w') -> Iterator:
+    """
+    Opens a temporary file beside the given file, which replaces the file
+    once written, so an interrupted write never leaves a partial file.
+    :param file_dir: str
+    :param mode: str
+    :return:
+        - file - IO
+    """
+    temp_dir = f"{file_dir}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_dir, mode) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_dir, file_dir)
+    except BaseException:
+        if os.path.exists(temp_dir):
+            os.remove(temp_dir)
+        raise
+
+
 def write(contents: Any = None, file_dir: str = '') -> None:
     """
     Writes the contents to file and checks extension
-    to determine a fit writing method.
+    to determine a fit writing method, the file is replaced
+    atomically.
     :param contents: Any
     :param file_dir: str
     :return:
@@ -47,16 +73,16 @@ def write(contents: Any = None, file_dir: str = '') -> None:
         contents = []
     try:
         if ".txt" in file_dir:
-            with open(file_dir, 'w') as file:
+            with atomic(file_dir, 'w') as file:
                 file.writelines(contents)
         elif ".json" in file_dir:
-            with open(file_dir, 'w') as file:
+            with atomic(file_dir, 'w') as file:
                 if not isinstance(contents, dict):
                     json.dump(contents.__dict__, file)
                 else:
                     json.dump(contents, file, indent=4)
         else:
-            with open(file_dir, 'wb') as file:
+            with atomic(file_dir, 'wb') as file:
                 pickle.dump(contents, file, pickle.HIGHEST_PROTOCOL)
     except Exception as e:
         logging.exception(e)
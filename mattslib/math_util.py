@@ -3,8 +3,8 @@ from __future__ import annotations
 import logging
 import math
 
-__version__ = '1.2.2'
-__date__ = '23/04/2022'
+__version__ = '1.2.3'
+__date__ = '17/10/2026'
 
 
 def absolute(x: float) -> float:
@@ -40,7 +40,7 @@ def sigmoid(x: float) -> float:
 
 
 def swish(x: float) -> float:
-    return x * sigmoid(x)
+    return x / (1 + math.exp(-max(-60.0, min(60.0, 5 * x))))
 
 
 def mean(array: list = None) -> int | float:
@@ -4,26 +4,59 @@ import random
 
 from mattslib import math_util
 
-__version__ = '1.4.1'
-__date__ = '19/03/2022'
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+__version__ = '1.5.0'
+__date__ = '17/10/2026'
 
-def getActivation(activation: str = '') -> activation_function:
+# Genomes store the activation ids, so new activations must only be appended
+ACTIVATIONS = ['absolute', 'binaryStep', 'clamped', 'identity', 'log', 'tanh', 'leakyReLU', 'sigmoid', 'swish']
+ACTIVATION_IDS = {activation: activation_id for activation_id, activation in enumerate(ACTIVATIONS)}
+
+SCALAR_ACTIVATIONS = [math_util.absolute,
+                      math_util.binaryStep,
+                      math_util.clamped,
+                      math_util.identity,
+                      math_util.log,
+                      math_util.tanh,
+                      math_util.leakyReLU,
+                      math_util.sigmoid,
+                      math_util.swish]
+
+ARRAY_ACTIVATIONS = [] if np is None else [np.abs,
+                                           lambda x: (x >= 0).astype(float),
+                                           lambda x: np.clip(x, -1.0, 1.0),
+                                           lambda x: x,
+                                           lambda x: np.log(np.maximum(1e-7, x)),
+                                           lambda x: np.tanh(np.clip(2.5 * x, -60.0, 60.0)),
+                                           lambda x: np.where(x > 0, x, 0.01 * x),
+                                           lambda x: 1 / (1 + np.exp(-np.clip(5 * x, -60.0, 60.0))),
+                                           lambda x: x / (1 + np.exp(-np.clip(5 * x, -60.0, 60.0)))]
+
+
+def getActivation(activation: str = '') -> int:
     """
-    Returns the requested or a random activation function.
+    Returns the requested or a random activation id.
     :param activation: str
     :return:
-        - activation_function - (x: int | float) -> int | float
+        - activation_id - int
+    """
+    if activation in ACTIVATION_IDS:
+        return ACTIVATION_IDS[activation]
+    return random.randrange(len(ACTIVATIONS))
+
+
+def getActivationId(activation: Any) -> int:
+    """
+    Returns the activation id of an activation id or a scalar activation function,
+    used to convert genomes that stored the functions.
+    :param activation: int | ((x: int | float) -> int | float)
+    :return:
+        - activation_id - int
     """
-    activations = {'absolute': math_util.absolute,
-                   'binaryStep': math_util.binaryStep,
-                   'clamped': math_util.clamped,
-                   'identity': math_util.identity,
-                   'log': math_util.log,
-                   'tanh': math_util.tanh,
-                   'leakyReLU': math_util.leakyReLU,
-                   'sigmoid': math_util.sigmoid,
-                   'swish': math_util.swish}
-    activation_function = activations[activation] if activation in activations \
-        else random.choice(list(activations.values()))
-    return activation_function
+    if isinstance(activation, int):
+        return activation
+    return ACTIVATION_IDS[activation.__name__]
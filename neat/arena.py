@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+from .genome import Genome
+from .packed import PackedGenome
+
+__version__ = '1.0.1'
+__date__ = '17/10/2026'
+
+# Values per record, every value is stored as a double
+HEADER_SIZE = 5  # inputs, outputs, activation, total nodes, total connections
+NODE_SIZE = 5  # layer type, depth, bias, activation, innovation
+CONNECTION_SIZE = 5  # node in, node out, weight, active, innovation
+
+# Arenas attached by the worker processes, keyed by name
+ATTACHED = {}
+
+
+def encodeGenome(genome: Genome) -> array:
+    """
+    Encodes the genome's topology, weights and biases into a flat array of doubles.
+    :param genome: Genome
+    :return:
+        - values - array[float]
+    """
+    values = array('d', [genome.inputs, genome.outputs, genome.activation, len(genome.nodes),
+                         len(genome.connections)])
+    for node_key in range(len(genome.nodes)):
+        node = genome.nodes[node_key]
+        values.extend((Genome.LAYER_TYPES.index(node.layer_type), node.depth, node.bias, node.activation,
+                       node.innovation))
+    for pos, connection in genome.connections.items():
+        values.extend((pos[0], pos[1], connection.weight, connection.active, connection.innovation))
+    return values
+
+
+def decodeGenome(view: memoryview, offset: int, node_info: dict) -> Genome:
+    """
+    Decodes the genome stored at the offset of the arena.
+    :param view: memoryview
+    :param offset: int
+    :param node_info: dict
+    :return:
+        - genome - Genome
+    """
+    inputs, outputs, activation, total_nodes, total_connections = map(int, view[offset:offset + HEADER_SIZE])
+    packed_genome = PackedGenome(inputs, outputs, node_info, activation)
+
+    offset += HEADER_SIZE
+    nodes = view[offset:offset + total_nodes * NODE_SIZE]
+    packed_genome.node_types = array('b', map(int, nodes[0::NODE_SIZE]))
+    packed_genome.node_depths = array('h', map(int, nodes[1::NODE_SIZE]))
+    packed_genome.node_biases = array('d', nodes[2::NODE_SIZE])
+    packed_genome.node_activations = array('B', map(int, nodes[3::NODE_SIZE]))
+    packed_genome.node_innovations = array('q', map(int, nodes[4::NODE_SIZE]))
+
+    offset += total_nodes * NODE_SIZE
+    connections = view[offset:offset + total_connections * CONNECTION_SIZE]
+    packed_genome.connection_sources = array('i', map(int, connections[0::CONNECTION_SIZE]))
+    packed_genome.connection_targets = array('i', map(int, connections[1::CONNECTION_SIZE]))
+    packed_genome.connection_weights = array('d', connections[2::CONNECTION_SIZE])
+    packed_genome.connection_actives = array('b', map(int, connections[3::CONNECTION_SIZE]))
+    packed_genome.connection_innovations = array('q', map(int, connections[4::CONNECTION_SIZE]))
+    return packed_genome.unpack()
+
+
+def attachArena(name: str) -> memoryview:
+    """
+    Attaches to the arena by name from a worker, the previous arenas are
+    detached as an arena is only replaced when it grows.
+    :param name: str
+    :return:
+        - view - memoryview
+    """
+    if name not in ATTACHED:
+        detachArenas()
+        memory = SharedMemory(name=name)
+        ATTACHED[name] = (memory, memory.buf.cast('d'))
+    return ATTACHED[name][1]
+
+
+def detachArenas() -> None:
+    """
+    Detaches the worker from every attached arena.
+    :return:
+        - None
+    """
+    for name in list(ATTACHED):
+        memory, view = ATTACHED.pop(name)
+        view.release()
+        memory.close()
+
+
+class GenomeArena(object):
+    """
+    GenomeArena is a block of shared memory holding the encoded genomes of the
+    population, so worker processes read genomes by offset. Each genome has a
+    slot which is only rewritten when the genome has changed.
+    """
+    def __init__(self, capacity: int = 1 << 16):
+        """
+        Initiates the GenomeArena object with a shared memory block.
+        :param capacity: int
+        """
+        self.memory = None
+        self.view = None
+        self.capacity = 0
+        self.top = 0
+        self.slots = {}
+        self.free = []
+        self.writes = 0
+        self.allocate(capacity)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def allocate(self, capacity: int) -> None:
+        """
+        Allocates a new shared memory block of at least the capacity, the used
+        values are copied into the new block.
+        :param capacity: int
+        :return:
+            - None
+        """
+        memory = SharedMemory(create=True, size=capacity * 8)
+        view = memory.buf.cast('d')
+        if self.memory is not None:
+            view[:self.top] = self.view[:self.top]
+            self.close()
+        self.memory, self.view, self.capacity = memory, view, len(view)
+
+    def reserve(self, size: int) -> int:
+        """
+        Reserves a region of the given size, reusing a free region if one fits.
+        The arena is compacted before the block would have to grow.
+        :param size: int
+        :return:
+            - offset - int
+        """
+        for free_key, (offset, free_size) in enumerate(self.free):
+            if free_size >= size:
+                if free_size > size:
+                    self.free[free_key] = (offset + size, free_size - size)
+                else:
+                    self.free.pop(free_key)
+                return offset
+
+        if self.top + size > self.capacity and self.free:
+            self.compact()
+        if self.top + size > self.capacity:
+            self.allocate(max(self.capacity * 2, self.top + size))
+        offset = self.top
+        self.top += size
+        return offset
+
+    def compact(self) -> None:
+        """
+        Moves the slots to the start of the arena in order, joining the free
+        regions after them.
+        :return:
+            - None
+        """
+        buffer = self.memory.buf
+        top = 0
+        for key, (offset, size, version) in sorted(self.slots.items(), key=lambda item: item[1][0]):
+            if offset != top:
+                buffer[top * 8:(top + size) * 8] = bytes(buffer[offset * 8:(offset + size) * 8])
+            self.slots[key] = (top, size, version)
+            top += size
+        self.free, self.top = [], top
+
+    def sync(self, genomes: list) -> list:
+        """
+        Writes the genomes which changed since the last sync into the arena,
+        freeing the slots of genomes no longer given.
+        :param genomes: list[Genome]
+        :return:
+            - offsets - list[int]
+        """
+        keys = {genome.key for genome in genomes}
+        for key in [key for key in self.slots if key not in keys]:
+            offset, size, _ = self.slots.pop(key)
+            self.free.append((offset, size))
+
+        for genome in genomes:
+            slot = self.slots.get(genome.key)
+            if slot is not None and slot[2] == genome.version:
+                continue
+            values = encodeGenome(genome)
+            if slot is None or slot[1] < len(values):
+                if slot is not None:
+                    del self.slots[genome.key]
+                    self.free.append((slot[0], slot[1]))
+                slot = (self.reserve(len(values)), len(values))
+            self.view[slot[0]:slot[0] + len(values)] = values
+            self.slots[genome.key] = (slot[0], slot[1], genome.version)
+            self.writes += 1
+        # Reserving can compact the arena, moving the slots written before
+        return [self.slots[genome.key][0] for genome in genomes]
+
+    def close(self) -> None:
+        """
+        Closes and unlinks the shared memory block.
+        :return:
+            - None
+        """
+        if self.memory is not None:
+            self.view.release()
+            self.memory.close()
+            self.memory.unlink()
+            self.memory, self.view = None, None
@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+from array import array
+from itertools import islice
+import json
+import struct
+import sys
+
+from .hall_of_fame import HallOfFame
+from .innovation import InnovationRegistry
+from .packed import GenomeSnapshot, PackedGenome
+from .settings import Settings
+from .specie import Specie, SpecieSnapshot
+from mattslib.file import atomic, read
+
+__version__ = '1.3.1'
+__date__ = '17/10/2026'
+
+# Magic, format version and length of the json metadata
+MAGIC = b'NEATBIN\x00'
+FORMAT_VERSION = 2
+HEADER = struct.Struct('<8sHQ')
+ARRAY_HEADER = struct.Struct('<cQ')
+
+GENOME_FIELDS = {'activations': 'B', 'fitnesses': 'd', 'adjusted_fitnesses': 'd', 'total_nodes': 'I',
+                 'total_connections': 'I'}
+NODE_FIELDS = {'node_types': 'b', 'node_depths': 'h', 'node_biases': 'd', 'node_activations': 'B',
+               'node_innovations': 'q'}
+CONNECTION_FIELDS = {'connection_sources': 'i', 'connection_targets': 'i', 'connection_weights': 'd',
+                     'connection_actives': 'b', 'connection_innovations': 'q'}
+# The genome's node and connection counters, the totals above are the lengths of its arrays
+COUNTER_FIELDS = {'counted_nodes': 'I', 'counted_connections': 'I'}
+# Settings which are kept out of saved models, as models are shared
+SECRET_SETTINGS = ['distributed_authkey']
+INNOVATION_FIELDS = {'split_connections': 'q', 'split_nodes': 'q', 'connection_ins': 'q', 'connection_outs': 'q',
+                     'connection_innovations': 'q'}
+
+
+def toNumber(value: float) -> int | float:
+    """
+    Converts a stored double back to an int when it holds a whole number.
+    :param value: float
+    :return:
+        - number - int | float
+    """
+    return int(value) if value.is_integer() else value
+
+
+class GenomeTable(object):
+    """
+    GenomeTable lays out genomes as parallel typed arrays, the nodes and
+    connections of every genome are concatenated into shared arrays.
+    """
+    def __init__(self, format_version: int = FORMAT_VERSION):
+        """
+        Initiates the GenomeTable object with empty arrays, tables of the
+        first format have no counters.
+        :param format_version: int
+        """
+        fields = (GENOME_FIELDS, NODE_FIELDS, CONNECTION_FIELDS) + ((COUNTER_FIELDS,) if format_version > 1 else ())
+        self.arrays = {field: array(typecode) for field_types in fields for field, typecode in field_types.items()}
+        self.node_offsets = []
+        self.connection_offsets = []
+
+    def add(self, genome: Genome | PackedGenome) -> int:
+        """
+        Adds the genome to the table.
+        :param genome: Genome | PackedGenome
+        :return:
+            - genome_key - int
+        """
+        packed_genome = genome if isinstance(genome, PackedGenome) else PackedGenome.pack(genome)
+        self.arrays['activations'].append(packed_genome.activation)
+        self.arrays['fitnesses'].append(packed_genome.fitness)
+        self.arrays['adjusted_fitnesses'].append(packed_genome.adjusted_fitness)
+        self.arrays['total_nodes'].append(len(packed_genome.node_types))
+        self.arrays['total_connections'].append(len(packed_genome.connection_sources))
+        for field in (*NODE_FIELDS, *CONNECTION_FIELDS):
+            self.arrays[field].extend(getattr(packed_genome, field))
+        self.arrays['counted_nodes'].append(packed_genome.total_nodes)
+        self.arrays['counted_connections'].append(packed_genome.total_connections)
+        return len(self.arrays['activations']) - 1
+
+    def index(self) -> None:
+        """
+        Indexes the offsets of each genome's nodes and connections.
+        :return:
+            - None
+        """
+        self.node_offsets, self.connection_offsets = [0], [0]
+        for total_nodes, total_connections in zip(self.arrays['total_nodes'], self.arrays['total_connections']):
+            self.node_offsets.append(self.node_offsets[-1] + total_nodes)
+            self.connection_offsets.append(self.connection_offsets[-1] + total_connections)
+
+    def get(self, genome_key: int, inputs: int, outputs: int, node_info: dict) -> PackedGenome:
+        """
+        Gets the genome of the table as a packed genome.
+        :param genome_key: int
+        :param inputs: int
+        :param outputs: int
+        :param node_info: dict
+        :return:
+            - packed_genome - PackedGenome
+        """
+        packed_genome = PackedGenome(inputs, outputs, node_info, self.arrays['activations'][genome_key])
+        packed_genome.fitness = toNumber(self.arrays['fitnesses'][genome_key])
+        packed_genome.adjusted_fitness = toNumber(self.arrays['adjusted_fitnesses'][genome_key])
+        start, end = self.node_offsets[genome_key], self.node_offsets[genome_key + 1]
+        for field in NODE_FIELDS:
+            setattr(packed_genome, field, self.arrays[field][start:end])
+        start, end = self.connection_offsets[genome_key], self.connection_offsets[genome_key + 1]
+        for field in CONNECTION_FIELDS:
+            setattr(packed_genome, field, self.arrays[field][start:end])
+        if 'counted_nodes' in self.arrays:
+            packed_genome.counted_nodes = self.arrays['counted_nodes'][genome_key]
+            packed_genome.counted_connections = self.arrays['counted_connections'][genome_key]
+        return packed_genome
+
+
+def writeArrays(file: Any, arrays: dict) -> None:
+    """
+    Writes each array with its typecode and length.
+    :param file: BinaryIO
+    :param arrays: dict[str: array]
+    :return:
+        - None
+    """
+    for values in arrays.values():
+        file.write(ARRAY_HEADER.pack(values.typecode.encode(), len(values)))
+        file.write(values.tobytes())
+
+
+def readArrays(file: Any, fields: Any, byteorder: str) -> dict:
+    """
+    Reads the arrays of the given fields in order, swapping their bytes when
+    written on a machine of another byte order.
+    :param file: BinaryIO
+    :param fields: Iterable[str]
+    :param byteorder: str
+    :return:
+        - arrays - dict[str: array]
+    """
+    arrays = {}
+    for field in fields:
+        typecode, length = ARRAY_HEADER.unpack(file.read(ARRAY_HEADER.size))
+        values = array(typecode.decode())
+        values.frombytes(file.read(length * values.itemsize))
+        if byteorder != sys.byteorder:
+            values.byteswap()
+        arrays[field] = values
+    return arrays
+
+
+def isCheckpoint(file_dir: str) -> bool:
+    """
+    Checks if the file is a binary checkpoint by its magic.
+    :param file_dir: str
+    :return:
+        - is_checkpoint - bool
+    """
+    try:
+        with open(file_dir, 'rb') as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def getRegistryArrays(innovations: InnovationRegistry, nodes_start: int = 0, connections_start: int = 0) -> dict:
+    """
+    Gets the registry's recorded innovations as arrays, from the given number
+    of nodes and connections already written.
+    :param innovations: InnovationRegistry
+    :param nodes_start: int
+    :param connections_start: int
+    :return:
+        - arrays - dict[str: array]
+    """
+    arrays = {field: array(typecode) for field, typecode in INNOVATION_FIELDS.items()}
+    for connection_innovation, node_innovation in islice(innovations.nodes.items(), nodes_start, None):
+        arrays['split_connections'].append(connection_innovation)
+        arrays['split_nodes'].append(node_innovation)
+    for (node_in, node_out), innovation in islice(innovations.connections.items(), connections_start, None):
+        arrays['connection_ins'].append(node_in)
+        arrays['connection_outs'].append(node_out)
+        arrays['connection_innovations'].append(innovation)
+    return arrays
+
+
+def updateRegistry(innovations: InnovationRegistry, arrays: dict) -> None:
+    """
+    Records the innovations of the arrays in the registry.
+    :param innovations: InnovationRegistry
+    :param arrays: dict[str: array]
+    :return:
+        - None
+    """
+    innovations.nodes.update(zip(arrays['split_connections'], arrays['split_nodes']))
+    innovations.connections.update(zip(zip(arrays['connection_ins'], arrays['connection_outs']),
+                                       arrays['connection_innovations']))
+
+
+def freezePacked(packed_genome: PackedGenome, generation: int, source: Any) -> GenomeSnapshot:
+    """
+    Freezes the packed genome into a snapshot of the given source.
+    :param packed_genome: PackedGenome
+    :param generation: int
+    :param source: Iterable[int]
+    :return:
+        - snapshot - GenomeSnapshot
+    """
+    state = {attribute: getattr(packed_genome, attribute) for attribute in PackedGenome.__slots__}
+    state = {attribute: tuple(value) if isinstance(value, array) else value for attribute, value in state.items()}
+    state['generation'], state['source'] = generation, tuple(source)
+    snapshot = GenomeSnapshot.__new__(GenomeSnapshot)
+    snapshot.__setstate__(state)
+    return snapshot
+
+
+def encodeState(neat: NEAT, getGenomeKey: Callable, getSnapshotKey: Callable) -> dict:
+    """
+    Encodes the NEAT's state as json metadata, the genomes and snapshots are
+    referenced by the keys the given callables store them under. Secret
+    settings are left out, and get their defaults when decoded.
+    :param neat: NEAT
+    :param getGenomeKey: Callable
+    :param getSnapshotKey: Callable
+    :return:
+        - metadata - dict[str: Any]
+    """
+    species = []
+    for specie in neat.species:
+        members = [getGenomeKey(member) for member in specie.members]
+        representative = next((genome_key for member, genome_key in zip(specie.members, members)
+                               if member is specie.representative), None)
+        if representative is None:
+            representative = getGenomeKey(specie.representative)
+        species.append({'members': members, 'representative': representative,
+                        'fitness_history': specie.fitness_history, 'fitness_mean': specie.fitness_mean})
+
+    hall_of_fame = [{'genome': getSnapshotKey(entry), 'generation': entry.generation, 'source': entry.source}
+                    for entry in neat.hall_of_fame]
+    best_specie = None
+    if neat.best_specie is not None:
+        best_specie = {'genome': getSnapshotKey(neat.best_specie.representative),
+                       'generation': neat.best_specie.generation,
+                       'source': neat.best_specie.representative.source,
+                       'fitness_history': neat.best_specie.fitness_history,
+                       'fitness_mean': neat.best_specie.fitness_mean}
+
+    return {
+        'byteorder': sys.byteorder,
+        'format_version': FORMAT_VERSION,
+        'settings': {name: value for name, value in neat.settings.__dict__.items() if name not in SECRET_SETTINGS},
+        'file_dir': neat.file_dir,
+        'file_name': neat.file_name,
+        'inputs': neat.inputs,
+        'outputs': neat.outputs,
+        'population': neat.population,
+        'generation': neat.generation,
+        'current_species': neat.current_species,
+        'current_genome': neat.current_genome,
+        'innovations': {'node_innovation': neat.innovations.node_innovation,
+                        'connection_innovation': neat.innovations.connection_innovation,
+                        'stride': neat.innovations.stride},
+        'species': species,
+        'hall_of_fame': hall_of_fame,
+        'best_specie': best_specie,
+    }
+
+
+def decodeState(metadata: dict, innovations: InnovationRegistry, getPacked: Callable) -> dict:
+    """
+    Decodes the NEAT's state from the json metadata, rebuilding its species,
+    genomes and snapshots from the packed genomes of the given callable.
+    :param metadata: dict[str: Any]
+    :param innovations: InnovationRegistry
+    :param getPacked: Callable
+    :return:
+        - state - dict[str: Any]
+    """
+    settings = Settings.__new__(Settings)
+    settings.__setstate__(metadata['settings'])
+    innovations.__dict__.update(metadata['innovations'])
+
+    species = []
+    for record in metadata['species']:
+        genomes = {}
+        for genome_key in record['members'] + [record['representative']]:
+            if genome_key not in genomes:
+                genomes[genome_key] = getPacked(genome_key, settings.node_info).unpack(innovations)
+        specie = Specie(settings, genomes[record['members'][0]])
+        specie.members = [genomes[genome_key] for genome_key in record['members']]
+        specie.representative = genomes[record['representative']]
+        specie.fitness_history = list(record['fitness_history'])
+        specie.fitness_mean = record['fitness_mean']
+        species.append(specie)
+
+    hall_of_fame = HallOfFame(settings.hall_of_fame_size)
+    hall_of_fame.entries = [freezePacked(getPacked(record['genome'], settings.node_info), record['generation'],
+                                         record['source']) for record in metadata['hall_of_fame']]
+
+    best_specie = None
+    if metadata['best_specie'] is not None:
+        record = metadata['best_specie']
+        best_specie = SpecieSnapshot.__new__(SpecieSnapshot)
+        best_specie.fitness_history = tuple(record['fitness_history'])
+        best_specie.fitness_mean = record['fitness_mean']
+        best_specie.representative = freezePacked(getPacked(record['genome'], settings.node_info),
+                                                  record['generation'], record['source'])
+        best_specie.generation = record['generation']
+
+    return {
+        'settings': settings,
+        'file_dir': metadata['file_dir'],
+        'file_name': metadata['file_name'],
+        'inputs': metadata['inputs'],
+        'outputs': metadata['outputs'],
+        'innovations': innovations,
+        'species': species,
+        'population': metadata['population'],
+        'generation': metadata['generation'],
+        'current_species': metadata['current_species'],
+        'current_genome': metadata['current_genome'],
+        'best_specie': best_specie,
+        'best_genome': hall_of_fame.best,
+        'hall_of_fame': hall_of_fame,
+    }
+
+
+def saveCheckpoint(neat: NEAT, file_dir: str) -> None:
+    """
+    Saves the NEAT as a binary checkpoint, the genomes are written as packed
+    arrays and the remaining state as json metadata. A snapshot of a member
+    is stored as the member's genome.
+    :param neat: NEAT
+    :param file_dir: str
+    :return:
+        - None
+    """
+    table = GenomeTable()
+    members = {}
+
+    def addGenome(genome: Genome) -> int:
+        packed_genome = PackedGenome.pack(genome)
+        members[(genome.key, genome.version)] = (table.add(packed_genome), packed_genome)
+        return members[(genome.key, genome.version)][0]
+
+    def addSnapshot(snapshot: GenomeSnapshot) -> int:
+        # The member can have been given another fitness, or be another genome of a past run with the same source
+        genome_key, packed_genome = members.get(snapshot.source, (None, None))
+        if packed_genome is not None and snapshot.__getstate__() == freezePacked(
+                packed_genome, snapshot.generation, snapshot.source).__getstate__():
+            return genome_key
+        return table.add(snapshot)
+
+    metadata = json.dumps(encodeState(neat, addGenome, addSnapshot)).encode()
+
+    with atomic(file_dir, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(metadata)))
+        file.write(metadata)
+        writeArrays(file, getRegistryArrays(neat.innovations))
+        writeArrays(file, table.arrays)
+
+
+def loadCheckpoint(file_dir: str) -> dict:
+    """
+    Loads the NEAT's state from a binary checkpoint, rebuilding its species,
+    genomes and snapshots.
+    :param file_dir: str
+    :return:
+        - state - dict[str: Any]
+    """
+    with open(file_dir, 'rb') as file:
+        magic, format_version, metadata_size = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"'{file_dir}' is not a binary NEAT checkpoint")
+        if format_version > FORMAT_VERSION:
+            raise ValueError(f"Checkpoint format {format_version} is newer than the supported {FORMAT_VERSION}")
+        metadata = json.loads(file.read(metadata_size).decode())
+        innovation_arrays = readArrays(file, INNOVATION_FIELDS, metadata['byteorder'])
+        table = GenomeTable(format_version)
+        table.arrays = readArrays(file, table.arrays, metadata['byteorder'])
+    table.index()
+
+    innovations = InnovationRegistry(metadata['inputs'] + metadata['outputs'])
+    updateRegistry(innovations, innovation_arrays)
+    return decodeState(metadata, innovations, lambda genome_key, node_info: table.get(
+        genome_key, metadata['inputs'], metadata['outputs'], node_info))
+
+
+def convertModel(file_dir: str, output_dir: str = None) -> None:
+    """
+    Converts a pickled model into a binary checkpoint, written over the model
+    when no output is given.
+    :param file_dir: str
+    :param output_dir: str | None
+    :return:
+        - None
+    """
+    if isCheckpoint(file_dir):
+        return
+    neat = read(file_dir)
+    if neat is None:
+        raise FileNotFoundError(f"Could not read the model '{file_dir}'")
+    saveCheckpoint(neat, output_dir if output_dir is not None else file_dir)
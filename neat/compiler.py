@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import math
+
+from .activations import ACTIVATIONS
+
+__version__ = '1.0.1'
+__date__ = '17/10/2026'
+
+ACTIVATION_SOURCES = {'absolute': "abs({x})",
+                      'binaryStep': "(1 if {x} >= 0 else 0)",
+                      'clamped': "max(-1.0, min(1.0, {x}))",
+                      'identity': "{x}",
+                      'log': "math.log(max(1e-7, {x}))",
+                      'tanh': "math.tanh(max(-60.0, min(60.0, 2.5 * {x})))",
+                      'leakyReLU': "({x} if {x} > 0 else 0.01 * {x})",
+                      'sigmoid': "1 / (1 + math.exp(-max(-60.0, min(60.0, 5 * {x}))))",
+                      'swish': "{x} / (1 + math.exp(-max(-60.0, min(60.0, 5 * {x}))))"}
+
+
+def compileSource(genome: Genome, name: str = 'forward') -> str:
+    """
+    Compiles the genome into the source of a standalone forward function, with
+    one assignment per node in depth order and the weights inlined as constants.
+    :param genome: Genome
+    :param name: str
+    :return:
+        - source - str
+    """
+    plan = genome.plan if genome.plan is not None else genome.buildPlan()
+
+    lines = [f"def {name}(inputs):"]
+    used_inputs = sorted({node_in for *_, nodes_in, _ in plan for node_in in nodes_in if node_in < genome.inputs})
+    for node_key in used_inputs:
+        lines.append(f"    n{node_key} = inputs[{node_key}]")
+
+    for node_out, _, bias, nodes_in, weights in plan:
+        activation = ACTIVATIONS[genome.nodes[node_out].activation]
+        if activation not in ACTIVATION_SOURCES:
+            raise ValueError(f"Activation '{activation}' has no compiled source")
+        node_sum = ''.join(f" + {weight!r} * n{node_in}" for node_in, weight in zip(nodes_in, weights))
+        lines.append(f"    x = 0{node_sum} + {bias!r}")
+        lines.append(f"    n{node_out} = {ACTIVATION_SOURCES[activation].format(x='x')}")
+
+    lines.append(f"    return [{', '.join(f'n{node_key}' for node_key in range(genome.inputs, genome.initial_nodes))}]")
+    return "import math\n\n\n" + '\n'.join(lines) + '\n'
+
+
+def compileGenome(genome: Genome, name: str = 'forward') -> forward_function:
+    """
+    Compiles the genome into a plain forward function.
+    :param genome: Genome
+    :param name: str
+    :return:
+        - forward_function - (inputs: list[int | float]) -> list[int | float]
+    """
+    namespace = {'math': math}
+    exec(compile(compileSource(genome, name), f"<genome {name}>", 'exec'), namespace)
+    return namespace[name]
+
+
+def writeSource(genome: Genome, file_dir: str, name: str = 'forward') -> None:
+    """
+    Writes the compiled source of the genome to a python file, which can be
+    imported without the neat package.
+    :param genome: Genome
+    :param file_dir: str
+    :param name: str
+    :return:
+        - None
+    """
+    with open(file_dir, 'w') as file:
+        file.write(compileSource(genome, name))
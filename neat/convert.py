@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import argparse
+
+from .checkpoint import convertModel
+
+__version__ = '1.0.0'
+__date__ = '17/10/2026'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Converts pickled NEAT models into binary checkpoints.")
+    parser.add_argument('models', nargs='+')
+    arguments = parser.parse_args()
+    for model in arguments.models:
+        convertModel(model)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from array import array
+import io
+import json
+import os
+import random
+import struct
+
+from .checkpoint import (INNOVATION_FIELDS, GenomeTable, decodeState, encodeState, getRegistryArrays, readArrays,
+                         toNumber, updateRegistry, writeArrays)
+from .innovation import InnovationRegistry
+
+__version__ = '1.1.1'
+__date__ = '17/10/2026'
+
+# Magic, kind, generation and payload length of each frame
+FRAME = struct.Struct('<4sBIQ')
+FRAME_MAGIC = b'NLOG'
+METADATA = struct.Struct('<Q')
+FULL, DELTA = 0, 1
+
+LOG_FIELDS = {'genome_keys': 'Q', 'member_fitnesses': 'd', 'member_adjusted_fitnesses': 'd'}
+
+
+class DeltaLog(object):
+    """
+    DeltaLog appends each saved generation to a log file. A frame only holds
+    the genomes which are new or changed since the previous frame, keyed by
+    stable ids, with the species membership, fitnesses and random state. A
+    full frame of every genome is written every snapshot interval to bound
+    the frames replayed on load.
+    """
+    def __init__(self, file_dir: str, snapshot_interval: int = 10):
+        """
+        Initiates the DeltaLog object, the first frame appended is full. A
+        frame left incomplete at the end of the log is cut off, so the frames
+        appended after it can be read.
+        :param file_dir: str
+        :param snapshot_interval: int
+        """
+        self.file_dir = file_dir
+        self.snapshot_interval = max(snapshot_interval, 1)
+        self.frames = 0
+        self.next_key = 0
+        self.genome_keys = {}
+        self.snapshot_keys = {}
+        self.snapshots = []
+        self.registry_size = (0, 0)
+
+        if os.path.isfile(file_dir):
+            frames = readFrames(file_dir)
+            with open(file_dir, 'r+b') as file:
+                file.truncate(frames[-1][2] + frames[-1][3] if frames else 0)
+
+    def append(self, neat: NEAT, random_state: tuple = None) -> None:
+        """
+        Appends a frame of the NEAT's current generation to the log, with the
+        given random state or else the current one.
+        :param neat: NEAT
+        :param random_state: tuple | None
+        :return:
+            - None
+        """
+        registry_size = (len(neat.innovations.nodes), len(neat.innovations.connections))
+        # A smaller registry is not the one the previous frames recorded
+        full = self.frames % self.snapshot_interval == 0 or any(
+            size < previous_size for size, previous_size in zip(registry_size, self.registry_size))
+        table = GenomeTable()
+        logged = array('Q')
+        genome_keys, snapshot_keys = {}, {}
+
+        def getKey(keys: dict, previous_keys: dict, source: Any, genome: Any) -> int:
+            if source not in keys:
+                if not full and source in previous_keys:
+                    keys[source] = previous_keys[source]
+                else:
+                    keys[source] = self.next_key
+                    self.next_key += 1
+                    table.add(genome)
+                    logged.append(keys[source])
+            return keys[source]
+
+        # Snapshots of one genome can differ in fitness, so each is identified by the object
+        snapshots = [*neat.hall_of_fame, *([neat.best_specie.representative] if neat.best_specie else [])]
+        metadata = encodeState(
+            neat,
+            lambda genome: getKey(genome_keys, self.genome_keys, (genome.key, genome.version), genome),
+            lambda snapshot: getKey(snapshot_keys, self.snapshot_keys, id(snapshot), snapshot))
+        metadata['rng'] = random_state if random_state is not None else random.getstate()
+        metadata = json.dumps(metadata).encode()
+
+        members = [member for specie in neat.species for member in specie.members]
+        arrays = {'genome_keys': logged,
+                  'member_fitnesses': array('d', [member.fitness for member in members]),
+                  'member_adjusted_fitnesses': array('d', [member.adjusted_fitness for member in members])}
+        registry_arrays = getRegistryArrays(neat.innovations, *((0, 0) if full else self.registry_size))
+
+        payload = io.BytesIO()
+        payload.write(METADATA.pack(len(metadata)))
+        payload.write(metadata)
+        writeArrays(payload, registry_arrays)
+        writeArrays(payload, arrays)
+        writeArrays(payload, table.arrays)
+        payload = payload.getvalue()
+        with open(self.file_dir, 'ab') as file:
+            file.write(FRAME.pack(FRAME_MAGIC, FULL if full else DELTA, neat.generation, len(payload)))
+            file.write(payload)
+
+        self.frames += 1
+        self.genome_keys, self.snapshot_keys = genome_keys, snapshot_keys
+        # Keeps the snapshots alive so their ids are not reused before the next frame
+        self.snapshots = snapshots
+        self.registry_size = registry_size
+
+
+def readFrames(file_dir: str) -> list:
+    """
+    Reads the header of each frame in the log, a frame left incomplete by an
+    interrupted write ends the log.
+    :param file_dir: str
+    :return:
+        - frames - list[tuple[int, int, int, int]]
+    """
+    frames = []
+    size = os.path.getsize(file_dir)
+    with open(file_dir, 'rb') as file:
+        while True:
+            header = file.read(FRAME.size)
+            if len(header) < FRAME.size:
+                break
+            magic, kind, generation, length = FRAME.unpack(header)
+            offset = file.tell()
+            if magic != FRAME_MAGIC or offset + length > size:
+                break
+            frames.append((kind, generation, offset, length))
+            file.seek(length, os.SEEK_CUR)
+    return frames
+
+
+def readFrame(file: Any, offset: int) -> tuple:
+    """
+    Reads the frame's metadata and arrays.
+    :param file: BinaryIO
+    :param offset: int
+    :return:
+        - metadata, registry_arrays, arrays, table - tuple[dict, dict, dict, GenomeTable]
+    """
+    file.seek(offset)
+    metadata = json.loads(file.read(METADATA.unpack(file.read(METADATA.size))[0]).decode())
+    registry_arrays = readArrays(file, INNOVATION_FIELDS, metadata['byteorder'])
+    arrays = readArrays(file, LOG_FIELDS, metadata['byteorder'])
+    # Frames of logs written before the format version was recorded have no counters
+    table = GenomeTable(metadata.get('format_version', 1))
+    table.arrays = readArrays(file, table.arrays, metadata['byteorder'])
+    table.index()
+    return metadata, registry_arrays, arrays, table
+
+
+def getGenerations(file_dir: str) -> list:
+    """
+    Gets the generations recorded in the log, in the order they were saved.
+    :param file_dir: str
+    :return:
+        - generations - list[int]
+    """
+    return [generation for _, generation, _, _ in readFrames(file_dir)]
+
+
+def loadLog(file_dir: str, generation: int = None) -> tuple:
+    """
+    Loads the NEAT's state of the generation from the log, the latest frame of
+    the generation is rebuilt by replaying the frames from the full frame
+    before it. The last frame is loaded when no generation is given.
+    :param file_dir: str
+    :param generation: int | None
+    :return:
+        - state, random_state - tuple[dict[str: Any], tuple]
+    """
+    frames = readFrames(file_dir)
+    targets = [frame_key for frame_key, frame in enumerate(frames) if generation is None or frame[1] == generation]
+    if not targets:
+        raise ValueError(f"Generation {generation} is not recorded in '{file_dir}'")
+    target = targets[-1]
+    start = max(frame_key for frame_key in range(target + 1) if frames[frame_key][0] == FULL)
+
+    genomes, innovations = {}, None
+    with open(file_dir, 'rb') as file:
+        for _, _, offset, _ in frames[start:target + 1]:
+            metadata, registry_arrays, arrays, table = readFrame(file, offset)
+            if innovations is None:
+                innovations = InnovationRegistry(metadata['inputs'] + metadata['outputs'])
+            updateRegistry(innovations, registry_arrays)
+
+            # Keeps only the genomes the frame refers to
+            records = [*metadata['hall_of_fame'], *([metadata['best_specie']] if metadata['best_specie'] else [])]
+            used = {genome_key for record in metadata['species'] for genome_key in
+                    record['members'] + [record['representative']]}
+            used.update(record['genome'] for record in records)
+            genomes = {genome_key: genomes[genome_key] for genome_key in used if genome_key in genomes}
+            for table_key, genome_key in enumerate(arrays['genome_keys']):
+                genomes[genome_key] = (table, table_key)
+
+    def getPacked(genome_key: int, node_info: dict) -> PackedGenome:
+        table, table_key = genomes[genome_key]
+        return table.get(table_key, metadata['inputs'], metadata['outputs'], node_info)
+
+    state = decodeState(metadata, innovations, getPacked)
+    members = [member for specie in state['species'] for member in specie.members]
+    for member, fitness, adjusted_fitness in zip(members, arrays['member_fitnesses'],
+                                                 arrays['member_adjusted_fitnesses']):
+        member.fitness, member.adjusted_fitness = toNumber(fitness), toNumber(adjusted_fitness)
+    random_state = (metadata['rng'][0], tuple(metadata['rng'][1]), metadata['rng'][2])
+    return state, random_state
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import concurrent.futures
+import ipaddress
+import logging
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener
+import queue
+import secrets
+import socket
+import threading
+import time
+
+__version__ = '1.2.1'
+__date__ = '17/10/2026'
+
+# The authkey of older settings, known to anyone
+DEFAULT_AUTHKEY = b'neat'
+
+
+def isLoopback(host: str) -> bool:
+    """
+    Checks if the host only accepts connections from this machine.
+    :param host: str
+    :return:
+        - loopback - bool
+    """
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class Coordinator(concurrent.futures.Executor):
+    """
+    Coordinator is an executor which sends the submitted calls to worker nodes
+    connected over TCP, started with 'python -m neat.worker'. A call given to a
+    worker which is lost is resubmitted to the remaining workers up to the
+    number of retries, the queued calls fail once every worker is lost.
+    """
+    def __init__(self, address: tuple = ('localhost', 6000), authkey: bytes = None, retries: int = 2):
+        """
+        Initiates the Coordinator object and starts listening for workers.
+        Workers run the calls they are sent and send back pickles, so without
+        an authkey a random one is generated and only loopback hosts are
+        allowed.
+        :param address: tuple[str, int]
+        :param authkey: bytes | None
+        :param retries: int
+        """
+        if (not authkey or authkey == DEFAULT_AUTHKEY) and not isLoopback(address[0]):
+            raise ValueError(f"A secret authkey must be set to listen on '{address[0]}'")
+        if not authkey:
+            authkey = secrets.token_hex(16).encode()
+        self.authkey = authkey
+        self.retries = retries
+        self.listener = Listener(tuple(address), authkey=authkey)
+        self.address = self.listener.address
+        self.tasks = queue.Queue()
+        self.connections = []
+        self.threads = []
+        self.lock = threading.Lock()
+        self.closed = False
+
+        self.accepter = threading.Thread(target=self.accept, daemon=True)
+        self.accepter.start()
+
+    @property
+    def total_workers(self) -> int:
+        with self.lock:
+            return len(self.connections)
+
+    def accept(self) -> None:
+        """
+        Accepts workers connecting to the coordinator, each worker is served
+        by its own thread. Accepting backs off while the listener keeps
+        failing, such as when out of file descriptors.
+        :return:
+            - None
+        """
+        delay = 0
+        while not self.closed:
+            try:
+                connection = self.listener.accept()
+            except (EOFError, ConnectionError, AuthenticationError):
+                # A client which failed to connect or authenticate
+                continue
+            except OSError as e:
+                if self.closed:
+                    return
+                logging.exception(e)
+                delay = min(max(delay * 2, 0.05), 1.0)
+                time.sleep(delay)
+                continue
+            delay = 0
+            if self.closed:
+                connection.close()
+                return
+            thread = threading.Thread(target=self.serve, args=(connection,), daemon=True)
+            with self.lock:
+                self.connections.append(connection)
+                self.threads.append(thread)
+            thread.start()
+
+    def serve(self, connection: Any) -> None:
+        """
+        Sends queued calls to the worker one at a time until the coordinator
+        shuts down or the worker is lost, the call in progress is requeued
+        when the worker is lost.
+        :param connection: multiprocessing.connection.Connection
+        :return:
+            - None
+        """
+        try:
+            while True:
+                task = self.tasks.get()
+                if task is None:
+                    connection.send(None)
+                    return
+                future, fn, args, kwargs, attempts = task
+                if not future.running() and not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    connection.send((fn, args, kwargs))
+                    succeeded, value = connection.recv()
+                except (OSError, EOFError):
+                    if attempts < self.retries:
+                        self.tasks.put((future, fn, args, kwargs, attempts + 1))
+                    else:
+                        future.set_exception(RuntimeError(f"The call was lost with {attempts + 1} workers"))
+                    return
+                except Exception as e:
+                    # The reply could not be unpickled
+                    succeeded, value = False, e
+                if succeeded:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+        except (OSError, EOFError):
+            pass
+        finally:
+            with self.lock:
+                self.connections.remove(connection)
+                lost = not self.connections and not self.closed
+            connection.close()
+            if lost:
+                self.failTasks(RuntimeError("Every worker was lost"))
+
+    def failTasks(self, error: Exception) -> None:
+        """
+        Fails the queued calls with the error.
+        :param error: Exception
+        :return:
+            - None
+        """
+        while True:
+            try:
+                task = self.tasks.get_nowait()
+            except queue.Empty:
+                return
+            if task is None:
+                continue
+            future = task[0]
+            if future.running() or future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        """
+        Queues the call for the next free worker.
+        :param fn: Callable
+        :param args: Any
+        :param kwargs: Any
+        :return:
+            - future - concurrent.futures.Future
+        """
+        if self.closed:
+            raise RuntimeError("Can not submit calls after the coordinator has shut down")
+        future = concurrent.futures.Future()
+        self.tasks.put((future, fn, args, kwargs, 0))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stops accepting workers and tells the connected workers to stop once
+        the queued calls are done.
+        :param wait: bool
+        :param cancel_futures: bool
+        :return:
+            - None
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if cancel_futures:
+            while not self.tasks.empty():
+                task = self.tasks.get_nowait()
+                if task is not None:
+                    task[0].cancel()
+
+        # Wakes the accepting thread with a plain connection, which does not wait on a thread that is backing off
+        try:
+            socket.create_connection(self.address, timeout=1).close()
+        except OSError:
+            pass
+        self.accepter.join()
+        self.listener.close()
+
+        for _ in range(self.total_workers):
+            self.tasks.put(None)
+        if wait:
+            for thread in self.threads:
+                thread.join()
+            # Calls left without a worker can no longer run
+            while not self.tasks.empty():
+                task = self.tasks.get_nowait()
+                if task is not None:
+                    task[0].cancel()
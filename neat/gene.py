@@ -1,34 +1,51 @@
 from __future__ import annotations
 
-__version__ = '1.4.2'
-__date__ = '11/04/2022'
+from .activations import getActivationId
+
+__version__ = '1.5.1'
+__date__ = '17/10/2026'
 
 
 class Node(object):
     """
     Contains key information about the node.
     """
-    def __init__(self, layer_type: str, activation: Any):
+    def __init__(self, layer_type: str, activation: int, innovation: int = None):
         """
         Initiates the Node object with default and given values.
         :param layer_type: str
-        :param activation: (x: int | float) -> int | float
+        :param activation: int
+        :param innovation: int | None
         """
         self.layer_type = layer_type
         self.activation = activation
+        self.innovation = innovation
         self.depth = 0
-        self.output = 0
         self.bias = 0
 
+    def __setstate__(self, state: dict) -> None:
+        """
+        Sets the node's state when unpickling, converting activation functions
+        from older models to activation ids.
+        :param state: dict[str: Any]
+        :return:
+            - None
+        """
+        state.pop('output', None)
+        self.__dict__.update(state)
+        self.activation = getActivationId(self.activation)
+
 
 class Connection(object):
     """
     Contains key information about the connection.
     """
-    def __init__(self, weight: int | float):
+    def __init__(self, weight: int | float, innovation: int = None):
         """
         Initiates the Connection object with default and given values.
         :param weight: int | float
+        :param innovation: int | None
         """
         self.weight = weight
+        self.innovation = innovation
         self.active = True
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+from copy import copy
+from itertools import count
 from math import ceil
 import random
 
-from .activations import getActivation
+from .activations import SCALAR_ACTIVATIONS, getActivation, getActivationId
+from .compiler import compileGenome
 from .gene import Node, Connection
+from .innovation import InnovationRegistry
+from .network import LayeredNetwork, connectionSaliencies, np
 
 import mattslib as ml
 from mattslib.dict import getKeyByWeights
 
-__version__ = '1.4.6'
-__date__ = '23/04/2022'
+__version__ = '1.6.1'
+__date__ = '17/10/2026'
+
+# Hands out a stable key to every genome in the process, copies are given their own
+GENOME_KEYS = count()
 
 
 class Genome(object):
@@ -21,16 +29,31 @@ class Genome(object):
 
     LAYER_TYPES = ['input', 'hidden', 'output']
 
-    def __init__(self, inputs: int, outputs: int, node_info: dict):
+    plan = None
+    network = None
+    compiled = None
+    genes = None
+    signature = None
+    version = 0
+
+    # Gene storage shared with clones is copied on the first write, owned holds
+    # the ids of the genes already copied, or None when every gene is owned
+    shared = False
+    owned = None
+
+    def __init__(self, inputs: int, outputs: int, node_info: dict, innovations: InnovationRegistry = None):
         """
         Initiates the Genome object with values and generates the initial network.
         :param inputs: int
         :param outputs: int
         :param node_info: dict
+        :param innovations: InnovationRegistry | None
         """
+        self.key = next(GENOME_KEYS)
         self.inputs = inputs
         self.outputs = outputs
         self.node_info = node_info
+        self.innovations = innovations if innovations is not None else InnovationRegistry(inputs + outputs)
         self.activations = node_info['activations']
         self.activation = getActivation(self.activations[0])
 
@@ -40,6 +63,8 @@ class Genome(object):
 
         self.connections = {}
         self.nodes = {}
+        self.incoming = {}
+        self.outgoing = {}
 
         self.fitness = 0
         self.adjusted_fitness = 0
@@ -57,13 +82,141 @@ class Genome(object):
         """
         for node_key in range(self.total_nodes):
             layer_type = self.LAYER_TYPES[0] if node_key < self.inputs else self.LAYER_TYPES[2]
-            self.nodes[node_key] = Node(layer_type, self.activation)
+            self.nodes[node_key] = Node(layer_type, self.activation, node_key)
             self.nodes[node_key].depth = 0 if layer_type == self.LAYER_TYPES[0] else self.max_depth
 
         for input_node in range(self.inputs):
             for output_node in range(self.inputs, self.initial_nodes):
                 self.addConnection((input_node, output_node), ((self.HIGH - self.LOW) * random.random() + self.LOW))
 
+    def __getstate__(self) -> dict:
+        """
+        Gets the genome's state for pickling and copying, without the cached
+        evaluation plan, network, compiled forward, distance signature,
+        connection index and innovation registry.
+        :return:
+            - state - dict[str: Any]
+        """
+        state = self.__dict__.copy()
+        state.pop('innovations', None)
+        state.pop('incoming', None)
+        state.pop('outgoing', None)
+        state.pop('plan', None)
+        state.pop('network', None)
+        state.pop('compiled', None)
+        state.pop('genes', None)
+        state.pop('signature', None)
+        state.pop('key', None)
+        state.pop('shared', None)
+        state.pop('owned', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Sets the genome's state when unpickling, converting the activation
+        function and stamping innovations for older models, and rebuilding the
+        connection index. The genome is given a registry of its own until the
+        population receiving it attaches theirs.
+        :param state: dict[str: Any]
+        :return:
+            - None
+        """
+        self.__dict__.update(state)
+        self.key = next(GENOME_KEYS)
+        self.activation = getActivationId(self.activation)
+        if 'innovations' not in state:
+            innovations = InnovationRegistry(self.initial_nodes)
+            if any(getattr(node, 'innovation', None) is None for node in self.nodes.values()):
+                self.stamp(innovations)
+            else:
+                self.innovations = innovations
+                innovations.register(self)
+        self.buildIndex()
+        # Pickled genomes may still share genes with their clones
+        self.share()
+        self.shared = True
+
+    def clone(self) -> Genome:
+        """
+        Clones the genome, the gene storage is shared between the genome and
+        the clone until either of them writes to it.
+        :return:
+            - clone - Genome
+        """
+        clone = Genome.__new__(Genome)
+        clone.__dict__.update(self.__dict__)
+        clone.key = next(GENOME_KEYS)
+        self.share()
+        clone.share()
+        self.shared = clone.shared = True
+        return clone
+
+    def share(self) -> None:
+        """
+        Marks every gene as shared, so each is copied before it is written.
+        :return:
+            - None
+        """
+        self.owned = set()
+
+    def own(self) -> None:
+        """
+        Copies the shared node and connection dicts and the connection index,
+        needed before they are written. The genes are still shared.
+        :return:
+            - None
+        """
+        if self.shared:
+            self.nodes = dict(self.nodes)
+            self.connections = dict(self.connections)
+            self.incoming = {node_key: set(self.incoming[node_key]) for node_key in self.incoming}
+            self.outgoing = {node_key: set(self.outgoing[node_key]) for node_key in self.outgoing}
+            self.shared = False
+
+    def ownNode(self, node_key: int) -> Node:
+        """
+        Gets the node to be written, copying it first if it is shared.
+        :param node_key: int
+        :return:
+            - node - Node
+        """
+        self.own()
+        node = self.nodes[node_key]
+        if self.owned is not None and id(node) not in self.owned:
+            node = self.nodes[node_key] = copy(node)
+            self.owned.add(id(node))
+        return node
+
+    def ownConnection(self, pos: tuple) -> Connection:
+        """
+        Gets the connection to be written, copying it first if it is shared.
+        :param pos: tuple[int, int]
+        :return:
+            - connection - Connection
+        """
+        self.own()
+        connection = self.connections[pos]
+        if self.owned is not None and id(connection) not in self.owned:
+            connection = self.connections[pos] = copy(connection)
+            self.owned.add(id(connection))
+        return connection
+
+    def stamp(self, innovations: InnovationRegistry) -> None:
+        """
+        Stamps every node and connection with innovations from the registry,
+        used for genomes from older models which have none.
+        :param innovations: InnovationRegistry
+        :return:
+            - None
+        """
+        self.innovations = innovations
+        for node_key in list(self.nodes):
+            self.ownNode(node_key).innovation = node_key if node_key < self.initial_nodes else innovations.getNode()
+        for pos in list(self.connections):
+            self.ownConnection(pos).innovation = innovations.getConnection(self.nodes[pos[0]].innovation,
+                                                                           self.nodes[pos[1]].innovation)
+        self.invalidate()
+
     def forward(self, inputs: list) -> list:
         """
         Calculates the output sum using inputs, weights and bias.
@@ -71,23 +224,118 @@ class Genome(object):
         :return:
             - output - list[int | float]
         """
-        for node_key in range(self.inputs):
-            self.nodes[node_key].output = inputs[node_key]
+        plan = self.plan if self.plan is not None else self.buildPlan()
 
-        nodes = {node_key: [] for node_key in self.nodes}
+        outputs = list(inputs[:self.inputs]) + [0] * (self.total_nodes - self.inputs)
+        for node_out, activation, bias, nodes_in, weights in plan:
+            node_sum = 0
+            for node_in, weight in zip(nodes_in, weights):
+                node_sum += weight * outputs[node_in]
+            outputs[node_out] = activation(node_sum + bias)
+        return outputs[self.inputs:self.initial_nodes]
 
-        active_connections = self.getActiveConnections()
-        for pos in active_connections:
-            nodes[pos[1]].append(pos[0])
+    def forwardBatch(self, inputs: Any) -> Any:
+        """
+        Calculates the outputs for each row of inputs in one pass, using the
+        layered network when NumPy is available.
+        :param inputs: list[list[int | float]] | ndarray
+        :return:
+            - outputs - ndarray | list[list[int | float]]
+        """
+        if np is None:
+            return [self.forward(row) for row in inputs]
+        return self.getNetwork().forwardBatch(inputs)
 
-        genome_nodes = self.getNodeByType(self.LAYER_TYPES[-2:])
-        for node_out in genome_nodes[self.LAYER_TYPES[1]] + genome_nodes[self.LAYER_TYPES[2]]:
-            node_sum = 0
-            for node_in in nodes[node_out]:
-                node_sum += self.connections[(node_in, node_out)].weight * self.nodes[node_in].output
-            node = self.nodes[node_out]
-            node.output = node.activation(node_sum + node.bias)
-        return [self.nodes[n].output for n in range(self.inputs, self.initial_nodes)]
+    def buildPlan(self) -> list:
+        """
+        Builds and caches the evaluation plan, the hidden and output nodes in
+        depth order with their activation, bias, incoming node keys and weights.
+        :return:
+            - plan - list[tuple[int, function, int | float, tuple[int], tuple[int | float]]]
+        """
+        incoming = {node_key: ([], []) for node_key in self.nodes}
+        for pos in self.getActiveConnections():
+            incoming[pos[1]][0].append(pos[0])
+            incoming[pos[1]][1].append(self.connections[pos].weight)
+
+        node_keys = [node_key for node_key in self.nodes if self.nodes[node_key].layer_type != self.LAYER_TYPES[0]]
+        node_keys.sort(key=lambda node_key: (self.nodes[node_key].depth, node_key))
+
+        self.plan = [(node_key, SCALAR_ACTIVATIONS[self.nodes[node_key].activation], self.nodes[node_key].bias,
+                      tuple(incoming[node_key][0]), tuple(incoming[node_key][1])) for node_key in node_keys]
+        return self.plan
+
+    def getNetwork(self, sparse: bool = None) -> LayeredNetwork:
+        """
+        Gets the cached NumPy layered network, building it if needed.
+        :param sparse: bool | None
+        :return:
+            - network - LayeredNetwork
+        """
+        if self.network is None or self.network.sparse != sparse:
+            self.network = LayeredNetwork(self, sparse)
+        return self.network
+
+    def getCompiled(self) -> forward_function:
+        """
+        Gets the cached compiled forward function, a straight-line version of
+        forward without any lookups, compiling it if needed.
+        :return:
+            - forward_function - (inputs: list[int | float]) -> list[int | float]
+        """
+        if self.compiled is None:
+            self.compiled = compileGenome(self)
+        return self.compiled
+
+    def getGenes(self) -> tuple:
+        """
+        Gets the cached node and connection genes, as (innovation, key) pairs
+        sorted by innovation.
+        :return:
+            - node_genes, connection_genes - tuple[list[tuple[int, int]], list[tuple[int, tuple[int, int]]]]
+        """
+        if self.genes is None:
+            self.genes = (sorted((self.nodes[node_key].innovation, node_key) for node_key in self.nodes),
+                          sorted((self.connections[pos].innovation, pos) for pos in self.connections))
+        return self.genes
+
+    def getSignature(self) -> tuple:
+        """
+        Gets the cached distance signature, the node and connection counts
+        with the gene innovations and their biases and weights, sorted by
+        innovation. Arrays are used when NumPy is available.
+        :return:
+            - signature - tuple[int, int, Any, Any, Any, Any]
+        """
+        if self.signature is None:
+            node_genes, connection_genes = self.getGenes()
+            node_innovations = [innovation for innovation, _ in node_genes]
+            biases = [self.nodes[node_key].bias for _, node_key in node_genes]
+            connection_innovations = [innovation for innovation, _ in connection_genes]
+            weights = [self.connections[pos].weight for _, pos in connection_genes]
+            if np is not None:
+                node_innovations = np.array(node_innovations, dtype=np.int64)
+                biases = np.array(biases, dtype=float)
+                connection_innovations = np.array(connection_innovations, dtype=np.int64)
+                weights = np.array(weights, dtype=float)
+            self.signature = (self.total_nodes, self.total_connections, node_innovations, biases,
+                              connection_innovations, weights)
+        return self.signature
+
+    def invalidate(self) -> None:
+        """
+        Discards the cached evaluation plan, network, compiled forward, sorted
+        genes and distance signature, needed after the genes have changed. The
+        version is counted up so cached distances are no longer matched.
+        :return:
+            - None
+        """
+        self.version += 1
+        self.plan = None
+        self.network = None
+        self.compiled = None
+        self.genes = None
+        self.signature = None
 
     def mutate(self, probabilities: dict) -> None:
         """
@@ -103,12 +351,12 @@ class Genome(object):
         node_key = random.choice(node_types[self.LAYER_TYPES[1]] + node_types[self.LAYER_TYPES[2]])
         if 'node' in mutation:
             if 'activation' in mutation:
-                self.nodes[node_key].activation = getActivation(random.choice(self.activations))
+                self.ownNode(node_key).activation = getActivation(random.choice(self.activations))
             elif 'bias' in mutation:
                 if 'set' in mutation:
-                    self.nodes[node_key].bias = random_number
+                    self.ownNode(node_key).bias = random_number
                 elif 'adjust' in mutation:
-                    self.nodes[node_key].bias += random_number
+                    self.ownNode(node_key).bias += random_number
             elif 'add' in mutation:
                 if not self.addNode():
                     self.mutate(probabilities)
@@ -118,26 +366,25 @@ class Genome(object):
             pos = random.choice(list(self.connections))
             if 'weight' in mutation:
                 if 'set' in mutation:
-                    self.connections[pos].weight = random_number
+                    self.ownConnection(pos).weight = random_number
                 elif 'adjust' in mutation:
-                    self.connections[pos].weight += random_number
+                    self.ownConnection(pos).weight += random_number
             elif 'add' in mutation:
                 self.addConnection(self.pair(), random_number)
             elif 'remove' in mutation:
-                if not self.removeConnection():
+                if not self.removeConnection(self.node_info.get('pruning_samples', 1)):
                     self.mutate(probabilities)
         elif 'activation' in mutation:
             self.activation = getActivation(random.choice(self.activations))
+        self.invalidate()
         self.reset()
 
     def reset(self) -> None:
         """
-        Resets the output for each node and the genome's fitness.
+        Resets the genome's fitness.
         :return:
             - None
         """
-        for node_key in self.nodes:
-            self.nodes[node_key].output = 0
         self.fitness = 0
 
     def addConnection(self, pos: tuple, weight: int | float) -> bool:
@@ -153,14 +400,71 @@ class Genome(object):
             return False
 
         # Adds the new connection
-        self.connections[pos] = Connection(weight)
+        innovation = self.innovations.getConnection(self.nodes[pos[0]].innovation, self.nodes[pos[1]].innovation)
+        self.setConnection(pos, Connection(weight, innovation))
         self.total_connections += 1
+        self.invalidate()
         return True
 
-    def removeConnection(self) -> bool:
+    def setConnection(self, pos: tuple, connection: Connection) -> None:
+        """
+        Sets the connection at the given position and updates the connection index.
+        :param pos: tuple[int, int]
+        :param connection: Connection
+        :return:
+            - None
+        """
+        self.own()
+        self.connections[pos] = connection
+        self.outgoing.setdefault(pos[0], set()).add(pos[1])
+        self.incoming.setdefault(pos[1], set()).add(pos[0])
+
+    def popConnection(self, pos: tuple) -> Connection:
+        """
+        Pops the connection at the given position and updates the connection index.
+        :param pos: tuple[int, int]
+        :return:
+            - connection - Connection
+        """
+        self.own()
+        self.outgoing[pos[0]].discard(pos[1])
+        self.incoming[pos[1]].discard(pos[0])
+        return self.connections.pop(pos)
+
+    def moveConnection(self, pos: tuple, new_pos: tuple) -> None:
+        """
+        Sets a copy of the connection at the new position, with the innovation
+        of the new position.
+        :param pos: tuple[int, int]
+        :param new_pos: tuple[int, int]
+        :return:
+            - None
+        """
+        innovation = self.innovations.getConnection(self.nodes[new_pos[0]].innovation,
+                                                    self.nodes[new_pos[1]].innovation)
+        connection = Connection(self.connections[pos].weight, innovation)
+        connection.active = self.connections[pos].active
+        self.setConnection(new_pos, connection)
+
+    def buildIndex(self) -> None:
+        """
+        Builds the connection index, the connected node keys going into and
+        out of each node.
+        :return:
+            - None
+        """
+        self.incoming = {node_key: set() for node_key in self.nodes}
+        self.outgoing = {node_key: set() for node_key in self.nodes}
+        for pos in self.connections:
+            self.outgoing[pos[0]].add(pos[1])
+            self.incoming[pos[1]].add(pos[0])
+
+    def removeConnection(self, samples: int = 1) -> bool:
         """
         Removes an eligible connection form the genome by weight pruning with
-        the optimal brain damage strategy.
+        the optimal brain damage strategy, using the mean saliency over a
+        sample of random inputs.
+        :param samples: int
         :return:
             - removed - bool
         """
@@ -173,19 +477,27 @@ class Genome(object):
         if not eligible_connections:
             return False
 
-        inputs = [round(random.random(), 3) for _ in range(self.inputs)]
-        outputs = self.forward(inputs)
-        saliencies = {}
-        for pos in eligible_connections:
-            self.connections[pos].active = False
-            saliency = ml.list.difference(outputs, self.forward(inputs))
-            saliencies[pos] = max([abs(i) for i in saliency])
-            self.connections[pos].active = True
+        inputs = [[round(random.random(), 3) for _ in range(self.inputs)] for _ in range(samples)]
+        if np is not None:
+            saliencies = dict(zip(eligible_connections, connectionSaliencies(self, eligible_connections, inputs)))
+        else:
+            outputs = [self.forward(sample) for sample in inputs]
+            saliencies = {}
+            for pos in eligible_connections:
+                self.ownConnection(pos).active = False
+                self.invalidate()
+                saliencies[pos] = 0
+                for sample_key, sample in enumerate(inputs):
+                    saliency = ml.list.difference(outputs[sample_key], self.forward(sample))
+                    saliencies[pos] += max([abs(i) for i in saliency]) / samples
+                self.connections[pos].active = True
+            self.invalidate()
 
         if saliencies:
             min_pos = min(saliencies, key=saliencies.get)
-            self.connections.pop(min_pos)
+            self.popConnection(min_pos)
             self.total_connections -= 1
+            self.invalidate()
             return True
         return False
 
@@ -202,13 +514,17 @@ class Genome(object):
         if self.nodes[pos[0]].depth < depth < self.nodes[pos[1]].depth:
             # Adds the new node and two new connections
             node_key = self.total_nodes
-            self.nodes[node_key] = Node(self.LAYER_TYPES[1], self.activation)
+            innovation = self.innovations.getNode(self.connections[pos].innovation,
+                                                  {self.nodes[key].innovation for key in self.nodes})
+            self.own()
+            self.nodes[node_key] = Node(self.LAYER_TYPES[1], self.activation, innovation)
             self.nodes[node_key].depth = depth
             self.total_nodes += 1
             self.addConnection((pos[0], node_key), 1.0)
             self.addConnection((node_key, pos[1]), self.connections[pos].weight)
-            self.connections.pop(pos)  # removes the previous connection
+            self.popConnection(pos)  # removes the previous connection
             self.total_connections -= 1
+            self.invalidate()
             return True
         return False
 
@@ -225,20 +541,24 @@ class Genome(object):
         connected_to, connected_from = self.getConnected(node_key)
         for pos in connected_to:
             if self.countConnected(pos)[0] == 1:
-                self.connections[(pos[0], connected_from[0][1])] = self.connections[pos]
+                self.moveConnection(pos, (pos[0], connected_from[0][1]))
         for pos in connected_from:
             if self.countConnected(pos)[1] == 1:
-                self.connections[(connected_to[0][0], pos[1])] = self.connections[pos]
+                self.moveConnection(pos, (connected_to[0][0], pos[1]))
 
         for pos in connected_to + connected_from:
-            self.connections.pop(pos)
+            self.popConnection(pos)
 
+        self.own()
         self.nodes.pop(node_key)
+        self.incoming.pop(node_key, None)
+        self.outgoing.pop(node_key, None)
         self.total_nodes -= 1
 
         # Updates the nodes and connections keys
         self.updateKeys()
         self.total_connections = len(self.connections)
+        self.invalidate()
         return True
 
     def updateKeys(self) -> None:
@@ -247,19 +567,19 @@ class Genome(object):
         :return:
             - None
         """
+        self.own()
         max_node_key = max(list(self.nodes))
         if max_node_key >= self.total_nodes:
             for node_key in range(self.total_nodes):
                 if node_key not in self.nodes:
-                    self.nodes[node_key] = self.nodes[max_node_key]
-                    self.nodes.pop(max_node_key)
-                    for pos in list(self.connections):
-                        if max_node_key == pos[0]:
-                            self.connections[(node_key, pos[1])] = self.connections[pos]
-                            self.connections.pop(pos)
-                        elif max_node_key == pos[1]:
-                            self.connections[(pos[0], node_key)] = self.connections[pos]
-                            self.connections.pop(pos)
+                    self.nodes[node_key] = self.nodes.pop(max_node_key)
+                    self.incoming[node_key], self.outgoing[node_key] = set(), set()
+                    for node_in in list(self.incoming[max_node_key]):
+                        self.setConnection((node_in, node_key), self.popConnection((node_in, max_node_key)))
+                    for node_out in list(self.outgoing[max_node_key]):
+                        self.setConnection((node_key, node_out), self.popConnection((max_node_key, node_out)))
+                    self.incoming.pop(max_node_key)
+                    self.outgoing.pop(max_node_key)
                     return
 
     def pair(self) -> tuple:
@@ -331,13 +651,7 @@ class Genome(object):
         :return:
             - connected_from, connected_to - tuple[int, int]
         """
-        connected_from, connected_to = 0, 0
-        for pos in self.connections:
-            if connection[0] == pos[0]:
-                connected_from += 1
-            if connection[1] == pos[1]:
-                connected_to += 1
-        return connected_from, connected_to
+        return len(self.outgoing.get(connection[0], ())), len(self.incoming.get(connection[1], ()))
 
     def getConnected(self, node_key: int) -> tuple:
         """
@@ -345,10 +659,6 @@ class Genome(object):
         :return:
             - connected_to, connected_from - tuple[list[tuple[int, int]], list[tuple[int, int]]]
         """
-        connected_to, connected_from = [], []
-        for pos in self.connections:
-            if node_key == pos[0]:
-                connected_from.append(pos)
-            if node_key == pos[1]:
-                connected_to.append(pos)
+        connected_to = [(node_in, node_key) for node_in in sorted(self.incoming.get(node_key, ()))]
+        connected_from = [(node_key, node_out) for node_out in sorted(self.outgoing.get(node_key, ()))]
         return connected_to, connected_from
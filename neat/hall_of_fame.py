@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from .packed import GenomeSnapshot
+
+__version__ = '1.1.0'
+__date__ = '17/10/2026'
+
+
+class HallOfFame(object):
+    """
+    HallOfFame keeps frozen snapshots of the fittest genomes seen, bounded to
+    a number of entries and sorted by fitness.
+    """
+    def __init__(self, size: int):
+        """
+        Initiates the HallOfFame object with the max number of entries, the
+        best genome is always kept.
+        :param size: int
+        """
+        self.size = max(size, 1)
+        self.entries = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.entries)
+
+    def __getitem__(self, key: int) -> GenomeSnapshot:
+        return self.entries[key]
+
+    @property
+    def best(self) -> GenomeSnapshot | None:
+        return self.entries[0] if self.entries else None
+
+    def qualifies(self, fitness: int | float) -> bool:
+        """
+        Checks if the fitness is high enough to enter the hall of fame.
+        :param fitness: int | float
+        :return:
+            - qualifies - bool
+        """
+        return len(self.entries) < self.size or fitness > self.entries[-1].fitness
+
+    def add(self, genome: Genome, generation: int = 0) -> bool:
+        """
+        Adds a snapshot of the genome if its fitness qualifies, a genome
+        already in the hall of fame is only replaced by a higher fitness.
+        :param genome: Genome
+        :param generation: int
+        :return:
+            - added - bool
+        """
+        if not self.qualifies(genome.fitness) or not self.release((genome.key, genome.version), genome.fitness):
+            return False
+        self.insert(GenomeSnapshot.freeze(genome, generation))
+        return True
+
+    def merge(self, snapshot: GenomeSnapshot) -> bool:
+        """
+        Adds the snapshot, from another hall of fame, if its fitness qualifies.
+        :param snapshot: GenomeSnapshot
+        :return:
+            - added - bool
+        """
+        if not self.qualifies(snapshot.fitness) or not self.release(snapshot.source, snapshot.fitness):
+            return False
+        self.insert(snapshot)
+        return True
+
+    def release(self, source: tuple, fitness: int | float) -> bool:
+        """
+        Removes the entry of the same source if it has a lower fitness.
+        :param source: tuple
+        :param fitness: int | float
+        :return:
+            - released - bool
+        """
+        for entry_key, entry in enumerate(self.entries):
+            if entry.source == source:
+                if fitness <= entry.fitness:
+                    return False
+                self.entries.pop(entry_key)
+                break
+        return True
+
+    def insert(self, snapshot: GenomeSnapshot) -> None:
+        """
+        Inserts the snapshot in fitness order, dropping the entries past the size.
+        :param snapshot: GenomeSnapshot
+        :return:
+            - None
+        """
+        entry_key = len(self.entries)
+        while entry_key > 0 and self.entries[entry_key - 1].fitness < snapshot.fitness:
+            entry_key -= 1
+        self.entries.insert(entry_key, snapshot)
+        del self.entries[self.size:]
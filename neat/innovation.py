@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+__version__ = '1.3.0'
+__date__ = '17/10/2026'
+
+
+class InnovationRegistry(object):
+    """
+    Hands out historical innovation ids to new nodes and connections, so the
+    same structural change shares an id across genomes. Registries of separate
+    populations are given strided namespaces, so their ids never collide, and
+    the connections of the initial topology have the same ids in each.
+    """
+    stride = 1
+    initial_nodes = 0
+
+    def __init__(self, initial_nodes: int, offset: int = 0, stride: int = 1):
+        """
+        Initiates the InnovationRegistry object, the input and output nodes
+        keep their node key as innovation. New ids start from the offset,
+        after the ids of the initial connections, and step by the stride.
+        :param initial_nodes: int
+        :param offset: int
+        :param stride: int
+        """
+        self.stride = stride
+        self.initial_nodes = initial_nodes
+        self.node_innovation = initial_nodes + offset
+        self.connection_innovation = initial_nodes * initial_nodes + offset
+        self.nodes = {}
+        self.connections = {}
+
+    def __copy__(self) -> InnovationRegistry:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> InnovationRegistry:
+        # The registry is shared by the whole population, copied genomes keep using it
+        return self
+
+    def snapshot(self) -> InnovationRegistry:
+        """
+        Copies the recorded innovations, so they can be saved while the
+        registry is still in use.
+        :return:
+            - snapshot - InnovationRegistry
+        """
+        snapshot = InnovationRegistry.__new__(InnovationRegistry)
+        snapshot.__dict__.update(self.__dict__)
+        snapshot.nodes = dict(self.nodes)
+        snapshot.connections = dict(self.connections)
+        return snapshot
+
+    def getNode(self, connection_innovation: int = None, taken: Any = ()) -> int:
+        """
+        Gets the innovation of a node splitting the given connection, a new
+        innovation is used if it is already taken.
+        :param connection_innovation: int | None
+        :param taken: set[int]
+        :return:
+            - innovation - int
+        """
+        if connection_innovation in self.nodes and self.nodes[connection_innovation] not in taken:
+            return self.nodes[connection_innovation]
+
+        innovation = self.node_innovation
+        self.node_innovation += self.stride
+        if connection_innovation is not None and connection_innovation not in self.nodes:
+            self.nodes[connection_innovation] = innovation
+        return innovation
+
+    def getConnection(self, node_in: int, node_out: int) -> int:
+        """
+        Gets the innovation of a connection between the given node innovations.
+        :param node_in: int
+        :param node_out: int
+        :return:
+            - innovation - int
+        """
+        if (node_in, node_out) not in self.connections:
+            if node_in < self.initial_nodes and node_out < self.initial_nodes:
+                # Connections between the input and output nodes are given the same ids in every namespace
+                self.connections[(node_in, node_out)] = node_in * self.initial_nodes + node_out
+            else:
+                self.connections[(node_in, node_out)] = self.connection_innovation
+                self.connection_innovation += self.stride
+        return self.connections[(node_in, node_out)]
+
+    def advance(self, current: int, innovation: int) -> int:
+        """
+        Gets the next free id of the namespace after the given innovation.
+        :param current: int
+        :param innovation: int
+        :return:
+            - next_innovation - int
+        """
+        if innovation < current:
+            return current
+        return innovation + 1 + (current - innovation - 1) % self.stride
+
+    def register(self, genome: Genome) -> None:
+        """
+        Records the innovations of a genome stamped by another registry, its
+        connections between nodes already known are given the registry's ids,
+        so they match the same genes of the registry's genomes.
+        :param genome: Genome
+        :return:
+            - None
+        """
+        relabelled = False
+        for pos in list(genome.connections):
+            connection = genome.connections[pos]
+            pair = (genome.nodes[pos[0]].innovation, genome.nodes[pos[1]].innovation)
+            if pair not in self.connections:
+                self.connections[pair] = connection.innovation
+                self.connection_innovation = self.advance(self.connection_innovation, connection.innovation)
+            elif connection.innovation != self.connections[pair]:
+                genome.ownConnection(pos).innovation = self.connections[pair]
+                relabelled = True
+        if relabelled:
+            genome.invalidate()
+        for node_key in genome.nodes:
+            self.node_innovation = self.advance(self.node_innovation, genome.nodes[node_key].innovation)
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import multiprocessing
+
+from .hall_of_fame import HallOfFame
+from .innovation import InnovationRegistry
+from .neat import NEAT
+
+__version__ = '1.0.0'
+__date__ = '17/10/2026'
+
+TOPOLOGIES = ['ring', 'full']
+
+
+def getDestinations(topology: str, islands: int) -> list:
+    """
+    Gets the islands each island sends its migrants to.
+    :param topology: str
+    :param islands: int
+    :return:
+        - destinations - list[list[int]]
+    """
+    if topology == TOPOLOGIES[0]:
+        return [[(island_key + 1) % islands] if islands > 1 else [] for island_key in range(islands)]
+    elif topology == TOPOLOGIES[1]:
+        return [[other for other in range(islands) if other != island_key] for island_key in range(islands)]
+    raise ValueError(f"Unknown topology '{topology}', expected one of {TOPOLOGIES}")
+
+
+def evolveIsland(neat: NEAT, handler: Callable, evaluator: Any, generations: int, args: tuple) -> tuple:
+    """
+    Evolves the island's population for the number of generations.
+    :param neat: NEAT
+    :param handler: Callable
+    :param evaluator: Any
+    :param generations: int
+    :param args: tuple[Any]
+    :return:
+        - generation, entries - tuple[int, list[GenomeSnapshot]]
+    """
+    for _ in range(generations):
+        if not neat.shouldEvolve():
+            break
+        results = neat.parallelTest(handler, *args)
+        neat.parallelEvolve(evaluator, results, *args)
+    return neat.generation, list(neat.hall_of_fame)
+
+
+def immigrateIsland(neat: NEAT, snapshots: list) -> None:
+    """
+    Takes the migrants into the island's population.
+    :param neat: NEAT
+    :param snapshots: list[GenomeSnapshot]
+    :return:
+        - None
+    """
+    neat.immigrate(snapshots)
+
+
+def getIsland(neat: NEAT) -> NEAT:
+    """
+    Gets the island's NEAT, sent back to the main process.
+    :param neat: NEAT
+    :return:
+        - neat - NEAT
+    """
+    return neat
+
+
+def runIsland(connection: Any, neat: NEAT) -> None:
+    """
+    Runs the calls sent to the island on its NEAT until told to stop.
+    :param connection: multiprocessing.connection.Connection
+    :param neat: NEAT
+    :return:
+        - None
+    """
+    with neat, connection:
+        while True:
+            try:
+                task = connection.recv()
+            except (OSError, EOFError):
+                return
+            if task is None:
+                return
+
+            fn, args = task
+            try:
+                result = (True, fn(neat, *args))
+            except Exception as e:
+                result = (False, e)
+            try:
+                connection.send(result)
+            except Exception as e:
+                # The result or error could not be pickled
+                connection.send((False, RuntimeError(repr(e))))
+
+
+class Islands(object):
+    """
+    Islands evolves separate NEAT populations in their own processes, each
+    with its own settings, and migrates the fittest genomes between them
+    along the topology every migration interval. The islands' innovations
+    are strided so ids never collide, and a global hall of fame is kept.
+    """
+    def __init__(self, environment_dir: str, file_name: str = '', islands: int = 4, topology: str = 'ring',
+                 migration_interval: int = 5, migrants: int = 2, hall_of_fame_size: int = 10):
+        """
+        Initiates the Islands object with a NEAT for each island, the settings
+        of each can be changed until the islands are started.
+        :param environment_dir: str
+        :param file_name: str
+        :param islands: int
+        :param topology: str
+        :param migration_interval: int
+        :param migrants: int
+        :param hall_of_fame_size: int
+        """
+        self.neats = [NEAT(environment_dir, f"{file_name}_island_{island_key}") for island_key in range(islands)]
+        self.destinations = getDestinations(topology, islands)
+        self.migration_interval = max(migration_interval, 1)
+        self.migrants = migrants
+        self.hall_of_fame = HallOfFame(hall_of_fame_size)
+        self.generation = 0
+
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self) -> Islands:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def best_genome(self) -> GenomeSnapshot | None:
+        return self.hall_of_fame.best
+
+    def generate(self, inputs: int, outputs: int, population: int = 100) -> None:
+        """
+        Generates each island's population, with innovations strided by the
+        number of islands.
+        :param inputs: int
+        :param outputs: int
+        :param population: int
+        :return:
+            - None
+        """
+        for island_key, neat in enumerate(self.neats):
+            innovations = InnovationRegistry(inputs + outputs, island_key, len(self.neats))
+            neat.generate(inputs, outputs, population, innovations)
+
+    def start(self) -> None:
+        """
+        Starts a process for each island, the NEATs are sent to the processes.
+        :return:
+            - None
+        """
+        if self.processes:
+            return
+        for neat in self.neats:
+            connection, island_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=runIsland, args=(island_connection, neat), daemon=True)
+            process.start()
+            island_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+
+    def request(self, tasks: list) -> list:
+        """
+        Sends each island its call and waits for every island to reply, the
+        first error raised by an island is raised once all have replied.
+        :param tasks: list[tuple[Callable, tuple]]
+        :return:
+            - results - list[Any]
+        """
+        sent = []
+        try:
+            for connection, task in zip(self.connections, tasks):
+                connection.send(task)
+                sent.append(connection)
+        finally:
+            # Islands already sent their call are still waited on, keeping the replies in order
+            replies = [connection.recv() for connection in sent]
+        for succeeded, value in replies:
+            if not succeeded:
+                raise value
+        return [value for _, value in replies]
+
+    def evolve(self, handler: Callable, evaluator: Any, *args: Any, generations: int = 1) -> None:
+        """
+        Evolves every island for the number of generations, migrating the
+        fittest genomes every migration interval. The handler and evaluator
+        are used as in parallelTest and parallelEvolve, so they must be
+        importable by the island processes.
+        :param handler: Callable
+        :param evaluator: Any
+        :param args: Any
+        :param generations: int
+        :return:
+            - None
+        """
+        self.start()
+        end_generation = self.generation + generations
+        while self.generation < end_generation:
+            steps = min(self.migration_interval - self.generation % self.migration_interval,
+                        end_generation - self.generation)
+            replies = self.request([(evolveIsland, (handler, evaluator, steps, args))] * len(self.neats))
+            self.generation += steps
+
+            for island_key, (_, entries) in enumerate(replies):
+                for entry in entries:
+                    self.hall_of_fame.merge(entry.relabel((island_key,) + entry.source))
+
+            if self.generation % self.migration_interval == 0 and self.migrants > 0:
+                self.migrate([entries[:self.migrants] for _, entries in replies])
+
+            # Every island has stopped evolving
+            if all(generation < self.generation for generation, _ in replies):
+                break
+
+    def migrate(self, emigrants: list) -> None:
+        """
+        Sends each island's emigrants to its destinations.
+        :param emigrants: list[list[GenomeSnapshot]]
+        :return:
+            - None
+        """
+        immigrants = [[] for _ in self.neats]
+        for island_key, destinations in enumerate(self.destinations):
+            for destination in destinations:
+                immigrants[destination].extend(emigrants[island_key])
+        self.request([(immigrateIsland, (snapshots,)) for snapshots in immigrants])
+
+    def collect(self) -> list:
+        """
+        Gets each island's NEAT back from its process.
+        :return:
+            - neats - list[NEAT]
+        """
+        if self.processes:
+            self.neats = self.request([(getIsland, ())] * len(self.neats))
+        return self.neats
+
+    def close(self) -> None:
+        """
+        Collects the islands' NEATs and stops their processes.
+        :return:
+            - None
+        """
+        if not self.processes:
+            return
+        try:
+            self.collect()
+        finally:
+            for connection in self.connections:
+                try:
+                    connection.send(None)
+                except OSError:
+                    pass
+                connection.close()
+            for process in self.processes:
+                process.join()
+            self.connections, self.processes = [], []
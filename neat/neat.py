@@ -1,45 +1,73 @@
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
-from copy import deepcopy
+import copy
+import inspect
+import os
+import pickle
 import random
 
+from .checkpoint import loadCheckpoint, isCheckpoint, saveCheckpoint
+from .delta import DeltaLog, loadLog
 from .genome import Genome
+from .hall_of_fame import HallOfFame
+from .innovation import InnovationRegistry
+from .network import PopulationNetwork, np
+from .parallel import WorkerPool, getWorkers
 from .settings import Settings
-from .specie import Specie, genomicDistance
-from mattslib.dict import countOccurrence, getKeyByWeights
-from mattslib.file import read, write
+from .specie import DistanceCache, Specie, SpeciesIndex
+from .writer import CheckpointWriter
+from mattslib.dict import getKeyByWeights
+from mattslib.file import atomic, read
 
-__version__ = '1.5.4'
-__date__ = '27/04/2022'
+__version__ = '1.14.4'
+__date__ = '17/10/2026'
 
 
 def genomicCrossover(x_member: Genome, y_member: Genome) -> Genome:
     """
-    Breeds a child genome from the given parent genomes.
+    Breeds a child genome from the given parent genomes, by aligning their
+    connection genes by innovation in a single merge pass.
     :param x_member: Genome
     :param y_member: Genome
     :return:
         - child - Genome
     """
-    child = Genome(x_member.inputs, x_member.outputs, x_member.node_info)
-    child.nodes = deepcopy(x_member.nodes)
-    child.total_nodes = x_member.total_nodes
+    child = x_member.clone()
     child.connections = {}
-
-    # Copy eligible connections
-    for pos in y_member.connections:
-        if pos[0] < child.total_nodes and pos[1] < child.total_nodes:
-            connection = child.checkPair(pos)
-            if connection is not None:
-                child.connections[connection] = deepcopy(y_member.connections[pos])
-
-    # Fill in remaining possible connections
-    for pos in x_member.connections:
-        if pos not in list(child.connections):
-            child.connections[pos] = deepcopy(x_member.connections[pos])
+    y_member.share()
+    node_keys = {child.nodes[node_key].innovation: node_key for node_key in child.nodes}
+
+    x_genes, y_genes = x_member.getGenes()[1], y_member.getGenes()[1]
+    x_key, y_key = 0, 0
+    while x_key < len(x_genes) or y_key < len(y_genes):
+        x_innovation = x_genes[x_key][0] if x_key < len(x_genes) else None
+        y_innovation = y_genes[y_key][0] if y_key < len(y_genes) else None
+        if y_innovation is None or (x_innovation is not None and x_innovation < y_innovation):
+            # Fill in remaining possible connections
+            pos = x_genes[x_key][1]
+            child.connections[pos] = x_member.connections[pos]
+            x_key += 1
+        elif x_innovation == y_innovation:
+            # Copy matching connections
+            child.connections[x_genes[x_key][1]] = y_member.connections[y_genes[y_key][1]]
+            x_key += 1
+            y_key += 1
+        else:
+            # Copy eligible connections
+            pos = y_genes[y_key][1]
+            node_in = node_keys.get(y_member.nodes[pos[0]].innovation)
+            node_out = node_keys.get(y_member.nodes[pos[1]].innovation)
+            if node_in is not None and node_out is not None and (node_in, node_out) not in child.connections and \
+                    child.checkPair((node_in, node_out)) == (node_in, node_out):
+                child.connections[(node_in, node_out)] = y_member.connections[pos]
+            y_key += 1
 
     child.total_connections = len(child.connections)
+    child.adjusted_fitness = 0
+    child.buildIndex()
+    child.invalidate()
     child.reset()
     return child
 
@@ -62,6 +90,7 @@ class NEAT(object):
         self.file_name = file_name
         self.inputs = 0
         self.outputs = 0
+        self.innovations = None
 
         self.species = []
         self.population = 0
@@ -72,28 +101,93 @@ class NEAT(object):
 
         self.best_specie = None
         self.best_genome = None
+        self.hall_of_fame = HallOfFame(self.settings.hall_of_fame_size)
+
+        self.distance_cache = DistanceCache(self.settings.distance_cache_size)
+        self.pool = None
+        self.delta_log = None
+        self.writer = None
+
+    def __enter__(self) -> NEAT:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
-    def generate(self, inputs: int, outputs: int, population: int = 100) -> None:
+    def __getstate__(self) -> dict:
+        """
+        Gets the NEAT's state for pickling, without the distance cache, worker
+        pool, delta log and checkpoint writer.
+        :return:
+            - state - dict[str: Any]
+        """
+        state = self.__dict__.copy()
+        state.pop('distance_cache', None)
+        state.pop('pool', None)
+        state.pop('delta_log', None)
+        state.pop('writer', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Sets the NEAT's state when unpickling, its genomes are given back the
+        innovation registry they share, older models are given a new registry
+        and their best specie and genome are converted to snapshots.
+        :param state: dict[str: Any]
+        :return:
+            - None
+        """
+        self.__dict__.update(state)
+        self.distance_cache = DistanceCache(self.settings.distance_cache_size)
+        self.pool = None
+        self.delta_log = None
+        self.writer = None
+        genomes = [genome for specie in self.species for genome in specie.members + [specie.representative]]
+        if 'innovations' in state:
+            for genome in {id(genome): genome for genome in genomes}.values():
+                genome.innovations = self.innovations
+        else:
+            self.innovations = InnovationRegistry(self.inputs + self.outputs)
+            if self.best_specie is not None:
+                genomes += self.best_specie.members
+            if self.best_genome is not None:
+                genomes.append(self.best_genome)
+            for genome in {id(genome): genome for genome in genomes}.values():
+                genome.stamp(self.innovations)
+        if 'hall_of_fame' not in state:
+            self.hall_of_fame = HallOfFame(self.settings.hall_of_fame_size)
+            if self.best_genome is not None:
+                self.hall_of_fame.add(self.best_genome, self.generation)
+                self.best_genome = self.hall_of_fame.best
+            if self.best_specie is not None:
+                self.best_specie = self.best_specie.snapshot(self.generation)
+
+    def generate(self, inputs: int, outputs: int, population: int = 100,
+                 innovations: InnovationRegistry = None) -> None:
         """
         Generates the NEAT with given values and classifies the genomes
-        into species.
+        into species, populations exchanging genomes are given registries
+        with separate namespaces.
         :param inputs: int
         :param outputs: int
         :param population: int
+        :param innovations: InnovationRegistry | None
         :return:
             - None
         """
         self.inputs = inputs
         self.outputs = outputs
         self.population = population
+        self.innovations = innovations if innovations is not None else InnovationRegistry(self.inputs + self.outputs)
+        self.delta_log = None
 
         # Creates and specifies the populace
-        for _ in range(self.population):
-            genome = Genome(self.inputs, self.outputs, self.settings.node_info)
-            self.classifyGenome(genome)
+        self.classifyGenomes([Genome(self.inputs, self.outputs, self.settings.node_info, self.innovations)
+                              for _ in range(self.population)])
 
-        self.best_specie = self.species[0]
-        self.best_genome = self.species[0].members[0]
+        self.hall_of_fame.add(self.species[0].members[0], self.generation)
+        self.best_specie = self.species[0].snapshot(self.generation)
+        self.best_genome = self.hall_of_fame.best
 
     def nextGenome(self) -> bool:
         """
@@ -119,26 +213,57 @@ class NEAT(object):
     def parallelTest(self, handler: Any, *args: Any) -> dict:
         """
         The environment will test the whole population by performing a forward
-        propagation using multithreading techniques.
+        propagation, using the executor backend from the settings. The process
+        backend needs a handler importable by the workers.
         :param handler: Any
         :param args: Any
         :return:
             - results - dict[tuple: float]
         """
         self.current_genome, self.current_species = 0, 0
-        threads, results = {}, {}
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            for specie_key, specie in enumerate(self.species):
-                for member_key, member in enumerate(specie.members):
-                    threads[(specie_key, member_key)] = executor.submit(handler, member, args)
-            for result_key in threads:
-                results[result_key] = threads[result_key].result()
+        members = {}
+        for specie_key, specie in enumerate(self.species):
+            for member_key, member in enumerate(specie.members):
+                members[(specie_key, member_key)] = member
+
+        outputs = self.getPool().mapGenomes(handler, list(members.values()), args)
+        return dict(zip(members, outputs))
+
+    def populationTest(self, encoder: Any, decoder: Any, *args: Any) -> dict:
+        """
+        The environment will test the whole population against shared inputs,
+        with every genome evaluated in one vectorized sweep.
+        The encoder is called as encoder(inputs, args) and returns the input rows with
+        a context, then each genome's outputs are passed to decoder(outputs, context).
+        :param encoder: Any
+        :param decoder: Any
+        :param args: Any
+        :return:
+            - results - dict[tuple: Any]
+        """
+        self.current_genome, self.current_species = 0, 0
+        members = {}
+        for specie_key, specie in enumerate(self.species):
+            for member_key, member in enumerate(specie.members):
+                members[(specie_key, member_key)] = member
+        if not members:
+            return {}
+
+        inputs, context = encoder(self.inputs, args)
+        if np is None:
+            outputs = [members[result_key].forwardBatch(inputs) for result_key in members]
+        else:
+            outputs = PopulationNetwork(list(members.values())).forwardBatch(inputs)
+
+        results = {}
+        for i, result_key in enumerate(members):
+            results[result_key] = decoder(outputs[i], context)
         return results
 
     def parallelEvolve(self, evaluator: Any, results: dict, *args: Any) -> None:
         """
-        Evaluates the whole population using multithreading techniques and then
-        evolves to form the next generation.
+        Evaluates the whole population using the executor backend from the
+        settings and then evolves to form the next generation.
         :param evaluator: Any
         :param results: dict[tuple: tuple]
         :param args: Any
@@ -147,14 +272,10 @@ class NEAT(object):
         """
         self.current_genome, self.current_species = 0, 0
         if callable(evaluator):
-            threads = {}
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                for result_key in results:
-                    threads[result_key] = executor.submit(evaluator, results[result_key], args)
-
-                for result_key in threads:
-                    member = self.species[result_key[0]].members[result_key[1]]
-                    member.fitness = threads[result_key].result()
+            fitnesses = self.getPool().mapResults(evaluator, list(results.values()), args)
+            for result_key, fitness in zip(results, fitnesses):
+                member = self.species[result_key[0]].members[result_key[1]]
+                member.fitness = fitness
         elif isinstance(evaluator, dict):
             for result_key in results:
                 member = self.species[result_key[0]].members[result_key[1]]
@@ -165,6 +286,190 @@ class NEAT(object):
         self.save()
         self.generationSave()
 
+    async def evaluateAsync(self, handler: Any, *args: Any, evolve: bool = True) -> None:
+        """
+        Evaluates the whole population with an awaitable handler and then evolves
+        to form the next generation. The handler is called as handler(genome, args)
+        and its fitness awaited, with at most the settings' async concurrency
+        awaiting at once.
+        :param handler: Any
+        :param args: Any
+        :param evolve: bool
+        :return:
+            - None
+        """
+        self.current_genome, self.current_species = 0, 0
+        semaphore = asyncio.Semaphore(self.settings.async_concurrency)
+
+        async def evaluate(member: Genome) -> None:
+            async with semaphore:
+                fitness = handler(member, args)
+                if inspect.isawaitable(fitness):
+                    fitness = await fitness
+            member.fitness = fitness
+
+        await asyncio.gather(*[evaluate(member) for specie in self.species for member in specie.members])
+
+        if evolve:
+            self.evolve()
+
+            self.save()
+            self.generationSave()
+
+    def steadyStateEvolve(self, handler: Any, evaluator: Any, *args: Any, generations: int = 1) -> None:
+        """
+        Evolves the population without a generational barrier, using the executor
+        backend from the settings. As each genome's evaluation finishes it is
+        ranked within its specie and the specie's worst evaluated member is
+        replaced by a child bred from the specie, which is queued for evaluation
+        straight away.
+        Every population's worth of evaluations closes a generation. The handler
+        is called as handler(genome, args) and the evaluator as in parallelEvolve.
+        :param handler: Any
+        :param evaluator: Any
+        :param args: Any
+        :param generations: int
+        :return:
+            - None
+        """
+        self.current_genome, self.current_species = 0, 0
+        pool = self.getPool()
+        owners, pending, evaluated = {}, {}, set()
+        end_generation = self.generation + generations
+
+        def submit(genomes: list, species: list) -> None:
+            for genome, specie in zip(genomes, species):
+                owners[genome.key] = specie
+                pending[pool.submitGenome(handler, genome, args)] = genome
+
+        def score(future: concurrent.futures.Future) -> Genome:
+            genome = pending.pop(future)
+            result = future.result()[0][0]
+            genome.fitness = evaluator(result, args) if callable(evaluator) else evaluator[result]
+            evaluated.add(genome.key)
+            return genome
+
+        def queue() -> None:
+            owners.clear()
+            queued = {genome.key for genome in pending.values()}
+            genomes, species = [], []
+            for specie in self.species:
+                for member in specie.members:
+                    owners[member.key] = specie
+                    if member.key not in evaluated and member.key not in queued:
+                        genomes.append(member)
+                        species.append(specie)
+            submit(genomes, species)
+
+        queue()
+        evaluations = 0
+        while pending and self.generation < end_generation:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                specie = owners.pop(score(future).key, None)
+                evaluations += 1
+                # Genomes of species killed while being evaluated are dropped
+                if specie is None or specie not in self.species:
+                    continue
+                child = self.replaceWorst(specie, evaluated)
+                if child is not None:
+                    submit([child], self.classifyGenomes([child]))
+
+            if evaluations >= self.population or not pending:
+                evaluations = 0
+                self.steadyStateGeneration()
+                if not self.shouldEvolve():
+                    break
+                evaluated.intersection_update({member.key for specie in self.species for member in specie.members})
+                queue()
+
+        # Scores the genomes still being evaluated, without breeding
+        for future in concurrent.futures.as_completed(list(pending)):
+            score(future)
+
+    def replaceWorst(self, specie: Specie, evaluated: set) -> Genome | None:
+        """
+        Replaces the specie's worst evaluated member with a child bred from the
+        specie. A specie with fewer than two evaluated members instead replaces
+        the worst evaluated genome of the other species, a specie left without
+        members is removed.
+        :param specie: Specie
+        :param evaluated: set[int]
+        :return:
+            - child - Genome | None
+        """
+        candidates = [(member, specie) for member in specie.members if member.key in evaluated]
+        if len(candidates) < 2:
+            candidates = [(member, other) for other in self.species if other is not specie
+                          for member in other.members if member.key in evaluated]
+        if not candidates:
+            return None
+
+        worst, worst_specie = min(candidates, key=lambda candidate: candidate[0].fitness)
+        worst_specie.members.remove(worst)
+        evaluated.discard(worst.key)
+        if not worst_specie.members:
+            self.species.remove(worst_specie)
+        elif worst_specie.representative is worst:
+            worst_specie.updateRepresentative()
+        return self.breed(self.settings.breed_probabilities, specie)
+
+    def steadyStateGeneration(self) -> None:
+        """
+        Closes a steady state generation by updating each specie's fitness history
+        and representative, killing the species which should not survive and
+        restoring the populace.
+        :return:
+            - None
+        """
+        for specie in self.species:
+            specie.updateFitness()
+            specie.updateFitnessHistory()
+            specie.updateRepresentative()
+
+        for specie_key in range(len(self.species) - 1, -1, -1):
+            if not self.species[specie_key].shouldSurvive():
+                self.species.pop(specie_key)
+        self.repopulate()
+
+        self.updateBest()
+        self.generation += 1
+
+        self.save()
+        self.generationSave()
+
+    def getPool(self) -> WorkerPool:
+        """
+        Gets the worker pool kept across generations, a new pool is started
+        when the executor settings have changed.
+        :return:
+            - pool - WorkerPool
+        """
+        if self.pool is not None and (self.pool.closed or self.pool.backend != self.settings.executor or
+                                      self.pool.workers != getWorkers(self.settings.workers)):
+            self.pool.close()
+            self.pool = None
+        if self.pool is None:
+            self.pool = WorkerPool(self.settings.executor, self.settings.workers, self.settings.chunk_size,
+                                   (self.settings.distributed_host, self.settings.distributed_port),
+                                   self.settings.distributed_authkey.encode() or None)
+        self.pool.chunk_size = self.settings.chunk_size
+        return self.pool
+
+    def close(self) -> None:
+        """
+        Closes the worker pool and writes the pending saves, a closed NEAT
+        starts a new pool and writer when needed.
+        :return:
+            - None
+        """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+        if self.writer is not None:
+            writer, self.writer = self.writer, None
+            writer.close()
+
     def shouldEvolve(self) -> bool:
         """
         Checks the settings if the current NEAT meets requirements to
@@ -224,7 +529,7 @@ class NEAT(object):
         remove_duplicate = False
         if self.generation % self.settings.remove_duplicate_interval == 0 and self.generation != 0:
             remove_duplicate = True
-        specie.killGenomes(remove_duplicate)
+        specie.killGenomes(remove_duplicate, distance_cache=self.distance_cache)
         specie.updateRepresentative()
         return True
 
@@ -241,22 +546,51 @@ class NEAT(object):
             fitness_sum = self.getFitnessSum()
 
             # Breeds the surviving populace
-            temp_species = self.species[:]
-            for specie_key, specie in enumerate(temp_species):
+            children = []
+            population_diff = self.population - self.getPopulation()
+            for specie in self.species:
                 if fitness_sum != 0:
-                    population_diff = self.population - self.getPopulation()
-                    offspring = round((specie.fitness_mean / fitness_sum) * population_diff)
+                    offspring = round((specie.fitness_mean / fitness_sum) * (population_diff - len(children)))
                     fitness_sum -= specie.fitness_mean
                     for _ in range(offspring):
-                        child = self.breed(self.settings.breed_probabilities, specie)
-                        self.classifyGenome(child)
+                        children.append(self.breed(self.settings.breed_probabilities, specie))
+            self.classifyGenomes(children)
 
         # Introduces new species and genomes if populace is not restored
+        genomes = []
         for p in range(self.population - self.getPopulation()):
-            genome = deepcopy(self.best_specie.representative) if p % 3 == 0 else Genome(self.inputs, self.outputs,
-                                                                                         self.settings.node_info)
+            if p % 3 == 0:
+                genome = self.best_specie.representative.unpack(self.innovations)
+            else:
+                genome = Genome(self.inputs, self.outputs, self.settings.node_info, self.innovations)
             genome.mutate(self.settings.mutation_probabilities)
-            self.classifyGenome(genome)
+            genomes.append(genome)
+        self.classifyGenomes(genomes)
+
+    def immigrate(self, snapshots: list) -> None:
+        """
+        Takes in genomes from another population, their innovations are
+        recorded and each replaces the least fit genome of the populace, a
+        specie left without members is removed.
+        :param snapshots: list[GenomeSnapshot]
+        :return:
+            - None
+        """
+        immigrants = []
+        for snapshot in snapshots:
+            immigrant = snapshot.unpack(self.innovations)
+            self.innovations.register(immigrant)
+            immigrants.append(immigrant)
+
+        members = sorted([(member, specie) for specie in self.species for member in specie.members],
+                         key=lambda candidate: candidate[0].fitness)
+        for member, specie in members[:len(immigrants)]:
+            specie.members.remove(member)
+            if not specie.members:
+                self.species.remove(specie)
+            elif specie.representative is member:
+                specie.updateRepresentative()
+        self.classifyGenomes(immigrants)
 
     def breed(self, probabilities: dict, specie: Specie) -> Genome:
         """
@@ -269,7 +603,7 @@ class NEAT(object):
         breed_by = getKeyByWeights(probabilities['breed'])
         # Asexual
         if breed_by == "asexual" or len(specie.members) == 1:
-            child = deepcopy(random.choice(specie.members))
+            child = random.choice(specie.members).clone()
             child.mutate(self.settings.mutation_probabilities)
             return child
 
@@ -283,34 +617,51 @@ class NEAT(object):
             y_member = random.choice(random.choice(species).members)
         return genomicCrossover(x_member, y_member)
 
-    def classifyGenome(self, genome: Genome) -> None:
+    def classifyGenome(self, genome: Genome) -> Specie:
         """
         Classifies the genome into first similar species or creates a new specie.
         :param genome: Genome
         :return:
-            - None
+            - specie - Specie
         """
-        for specie in self.species:
-            distance = genomicDistance(genome, specie.representative, self.settings.distance_weights)
-            if distance <= self.settings.delta_genome_threshold:
+        return self.classifyGenomes([genome])[0]
+
+    def classifyGenomes(self, genomes: list) -> list:
+        """
+        Classifies each genome into the first similar species or creates a new
+        specie, the species are indexed so only those which could be within the
+        threshold are compared.
+        :param genomes: list[Genome]
+        :return:
+            - species - list[Specie]
+        """
+        species_index = SpeciesIndex(self.settings, self.species, self.distance_cache)
+        species = []
+        for genome in genomes:
+            specie = species_index.classify(genome)
+            if specie is not None:
                 specie.members.append(genome)
-                return
-        self.species.append(Specie(self.settings, genome))
-        return
+            else:
+                specie = Specie(self.settings, genome)
+                self.species.append(specie)
+                species_index.add(specie)
+            species.append(specie)
+        return species
 
     def updateBest(self) -> None:
         """
         Updates the best specie and genome by searching for best fitness history
-        and highest adjusted fitness.
+        and highest adjusted fitness, the representatives are offered to the
+        hall of fame and the best genome is its fittest snapshot.
         :return:
             - None
         """
         for specie in self.species:
             specie.updateRepresentative()
-            if specie.fitness_history > self.best_specie.fitness_history:
-                self.best_specie = deepcopy(specie)
-            if specie.representative.fitness > self.best_genome.fitness:
-                self.best_genome = deepcopy(specie.representative)
+            if tuple(specie.fitness_history) > self.best_specie.fitness_history:
+                self.best_specie = specie.snapshot(self.generation)
+            self.hall_of_fame.add(specie.representative, self.generation)
+        self.best_genome = self.hall_of_fame.best
 
     def getFitnessSum(self) -> int | float:
         """
@@ -362,30 +713,118 @@ class NEAT(object):
 
     def generationSave(self) -> None:
         """
-        Saves a model of current generation if requirements are met.
+        Saves a model of current generation if requirements are met, the delta
+        log already keeps every generation.
         :return:
             - None
         """
+        if self.settings.save_format == 'log':
+            return
         if self.generation in self.settings.save_intervals or \
                 self.settings.save_model_interval != 0 and self.generation % self.settings.save_model_interval == 0:
             self.save(f"{self.file_name}_gen_{self.generation}")
 
     def save(self, file_name: str = None) -> None:
         """
-        Saves the NEAT object by writing to file.
+        Saves the NEAT object by writing to file, the log format appends the
+        generation to the NEAT's delta log. Saving in the background writes a
+        snapshot of the NEAT from the checkpoint writer's thread, while
+        training continues.
         :param file_name: str
         :return:
             - None
         """
         file_name = file_name if file_name is not None else self.file_name
-        write(self, self.file_dir + file_name + '.neat')
+        append = self.settings.save_format == 'log' and file_name == self.file_name
+        if append:
+            if self.delta_log is None or self.delta_log.file_dir != self.file_dir + file_name + '.neatlog':
+                self.delta_log = DeltaLog(self.file_dir + file_name + '.neatlog', self.settings.log_snapshot_interval)
+        if not self.settings.save_in_background:
+            self.writeModel(file_name)
+            return
+        if self.writer is None:
+            self.writer = CheckpointWriter()
+        # The random state is taken from the training thread, every generation's frame is appended to the log
+        self.writer.submit(file_name, self.snapshot().writeModel, file_name, random.getstate(), coalesce=not append)
+
+    def writeModel(self, file_name: str, random_state: tuple = None) -> None:
+        """
+        Writes the NEAT to file in the save format, models are replaced
+        atomically so an interrupted write keeps the previous model.
+        :param file_name: str
+        :param random_state: tuple | None
+        :return:
+            - None
+        """
+        if self.settings.save_format == 'log' and file_name == self.file_name:
+            self.delta_log.append(self, random_state)
+        elif self.settings.save_format == 'pickle':
+            with atomic(self.file_dir + file_name + '.neat', 'wb') as file:
+                pickle.dump(self, file)
+        else:
+            saveCheckpoint(self, self.file_dir + file_name + '.neat')
+
+    def snapshot(self) -> NEAT:
+        """
+        Copies the NEAT's current generation to be saved while training
+        continues. The genomes are cloned sharing their genes until either
+        copy writes to them, and keep their keys.
+        :return:
+            - snapshot - NEAT
+        """
+        snapshot = NEAT.__new__(NEAT)
+        snapshot.__dict__.update(self.__dict__)
+        snapshot.settings = copy.deepcopy(self.settings)
+        snapshot.innovations = self.innovations.snapshot()
+        snapshot.hall_of_fame = copy.copy(self.hall_of_fame)
+        snapshot.hall_of_fame.entries = list(self.hall_of_fame.entries)
+        snapshot.distance_cache = None
+        snapshot.pool = None
+        snapshot.writer = None
+
+        clones = {}
+        snapshot.species = []
+        for specie in self.species:
+            specie_snapshot = copy.copy(specie)
+            specie_snapshot.settings = snapshot.settings
+            specie_snapshot.fitness_history = list(specie.fitness_history)
+            for member in specie.members + [specie.representative]:
+                if id(member) not in clones:
+                    clones[id(member)] = member.clone()
+                    clones[id(member)].key = member.key
+            specie_snapshot.members = [clones[id(member)] for member in specie.members]
+            specie_snapshot.representative = clones[id(specie.representative)]
+            snapshot.species.append(specie_snapshot)
+        return snapshot
+
+    def flush(self) -> None:
+        """
+        Waits until the saves made in the background are written, raising
+        the error of a save that failed.
+        :return:
+            - None
+        """
+        if self.writer is not None:
+            self.writer.flush()
 
     @staticmethod
-    def load(file_dir: str) -> NEAT:
+    def load(file_dir: str, generation: int = None) -> NEAT:
         """
-        Loads the NEAT object by reading the file.
+        Loads the NEAT object by reading the file, either a binary checkpoint
+        or a pickled model. The delta log is read when a generation is given or
+        there is no model, restoring the random state of the generation.
         :param file_dir: str
+        :param generation: int | None
         :return:
             - neat - NEAT
         """
-        return read(file_dir + '.neat')
+        if generation is not None or not os.path.isfile(file_dir + '.neat') and os.path.isfile(file_dir + '.neatlog'):
+            state, random_state = loadLog(file_dir + '.neatlog', generation)
+            random.setstate(random_state)
+        elif isCheckpoint(file_dir + '.neat'):
+            state = loadCheckpoint(file_dir + '.neat')
+        else:
+            return read(file_dir + '.neat')
+        neat = NEAT.__new__(NEAT)
+        neat.__setstate__(state)
+        return neat
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from .activations import ARRAY_ACTIVATIONS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__version__ = '1.0.1'
+__date__ = '17/10/2026'
+
+
+class LayeredNetwork(object):
+    """
+    LayeredNetwork is a NumPy version of a genome, where each depth is evaluated
+    as a single weight block product followed by grouped activations.
+    """
+    DENSITY_THRESHOLD = 0.1
+
+    def __init__(self, genome: Genome, sparse: bool = None):
+        """
+        Initiates the LayeredNetwork object by grouping the genome's nodes by
+        depth and building the weight blocks.
+        :param genome: Genome
+        :param sparse: bool | None
+        """
+        if np is None:
+            raise ImportError("LayeredNetwork requires NumPy")
+
+        self.inputs = genome.inputs
+        self.outputs = genome.outputs
+        self.sparse = sparse
+
+        node_keys = sorted(genome.nodes, key=lambda node_key: (genome.nodes[node_key].depth, node_key))
+        self.total_nodes = len(node_keys)
+        index = {node_key: i for i, node_key in enumerate(node_keys)}
+        self.output_index = np.array([index[node_key] for node_key in range(genome.inputs, genome.initial_nodes)])
+
+        incoming = {node_key: [] for node_key in genome.nodes}
+        for pos in genome.getActiveConnections():
+            incoming[pos[1]].append((index[pos[0]], genome.connections[pos].weight))
+
+        self.layers = []
+        node_depths = genome.getNodesByDepth()
+        start = len(node_depths[0])
+        for depth in range(1, genome.max_depth + 1):
+            if not node_depths[depth]:
+                continue
+            layer_nodes = node_keys[start:start + len(node_depths[depth])]
+            self.layers.append(self.buildLayer(genome, layer_nodes, incoming, start, sparse))
+            start += len(layer_nodes)
+
+    def buildLayer(self, genome: Genome, layer_nodes: list, incoming: dict, start: int, sparse: bool = None) -> dict:
+        """
+        Builds the weight block, bias vector and activation groups of a depth,
+        its nodes only receive from the preceding positions.
+        :param genome: Genome
+        :param layer_nodes: list[int]
+        :param incoming: dict[int: list[tuple[int, int | float]]]
+        :param start: int
+        :param sparse: bool | None
+        :return:
+            - layer - dict[str: Any]
+        """
+        sources, targets, weights = [], [], []
+        activations = {}
+        for i, node_key in enumerate(layer_nodes):
+            for source, weight in incoming[node_key]:
+                sources.append(source)
+                targets.append(i)
+                weights.append(weight)
+            activation = genome.nodes[node_key].activation
+            if activation not in activations:
+                activations[activation] = []
+            activations[activation].append(i)
+
+        if sparse is None:
+            sparse = len(weights) < self.DENSITY_THRESHOLD * start * len(layer_nodes)
+
+        layer = {'start': start, 'end': start + len(layer_nodes), 'sparse': sparse,
+                 'bias': np.array([genome.nodes[node_key].bias for node_key in layer_nodes], dtype=float),
+                 'activations': [(ARRAY_ACTIVATIONS[activation], np.array(activations[activation]))
+                                 for activation in activations]}
+        if sparse:
+            layer['sources'] = np.array(sources, dtype=int)
+            layer['targets'] = np.array(targets, dtype=int)
+            layer['weights'] = np.array(weights, dtype=float)
+        else:
+            layer['weights'] = np.zeros((start, len(layer_nodes)))
+            np.add.at(layer['weights'], (sources, targets), weights)
+        return layer
+
+    def forward(self, inputs: Any) -> ndarray:
+        """
+        Calculates the outputs for a single input vector.
+        :param inputs: list[int | float] | ndarray
+        :return:
+            - outputs - ndarray
+        """
+        return self.forwardBatch(np.asarray(inputs, dtype=float).reshape(1, -1))[0]
+
+    def forwardBatch(self, inputs: Any) -> ndarray:
+        """
+        Calculates the outputs for each row of inputs, depth by depth.
+        :param inputs: list[list[int | float]] | ndarray
+        :return:
+            - outputs - ndarray
+        """
+        inputs = np.asarray(inputs, dtype=float)
+        values = np.zeros((inputs.shape[0], self.total_nodes))
+        values[:, :self.inputs] = inputs[:, :self.inputs]
+
+        for layer in self.layers:
+            start, end = layer['start'], layer['end']
+            if layer['sparse']:
+                node_sums = np.zeros((inputs.shape[0], end - start))
+                np.add.at(node_sums, (slice(None), layer['targets']),
+                          values[:, layer['sources']] * layer['weights'])
+            else:
+                # einsum keeps each row's sum independent of the batch, unlike BLAS, so equal rows stay equal
+                node_sums = np.einsum('ij,jk->ik', values[:, :start], layer['weights'])
+            node_sums += layer['bias']
+
+            outputs = values[:, start:end]
+            for activation, node_indexes in layer['activations']:
+                outputs[:, node_indexes] = activation(node_sums[:, node_indexes])
+        return values[:, self.output_index]
+
+
+class PopulationNetwork(object):
+    """
+    PopulationNetwork packs a population of genomes into one block-sparse
+    network, so every genome is evaluated against shared inputs in one sweep.
+    """
+    def __init__(self, genomes: list):
+        """
+        Initiates the PopulationNetwork object by stacking each genome's nodes by
+        depth and their connections into shared arrays.
+        :param genomes: list[Genome]
+        """
+        if np is None:
+            raise ImportError("PopulationNetwork requires NumPy")
+
+        self.inputs = genomes[0].inputs
+        self.outputs = genomes[0].outputs
+        self.size = len(genomes)
+
+        # Orders the nodes by depth, then by genome so each genome's inputs are packed together
+        max_depth = max(genome.max_depth for genome in genomes)
+        depth_nodes = {depth: [] for depth in range(max_depth + 1)}
+        for genome_key, genome in enumerate(genomes):
+            node_depths = genome.getNodesByDepth()
+            for depth in node_depths:
+                depth_nodes[depth] += [(genome_key, node_key) for node_key in sorted(node_depths[depth])]
+
+        index, depth_ranges = {}, {}
+        for depth in depth_nodes:
+            depth_ranges[depth] = (len(index), len(index) + len(depth_nodes[depth]))
+            for node in depth_nodes[depth]:
+                index[node] = len(index)
+        self.total_nodes = len(index)
+        self.output_index = np.array([[index[(genome_key, node_key)]
+                                       for node_key in range(genome.inputs, genome.initial_nodes)]
+                                      for genome_key, genome in enumerate(genomes)])
+
+        incoming = {depth: [] for depth in depth_nodes}
+        for genome_key, genome in enumerate(genomes):
+            for pos in genome.getActiveConnections():
+                incoming[genome.nodes[pos[1]].depth].append((index[(genome_key, pos[1])], index[(genome_key, pos[0])],
+                                                             genome.connections[pos].weight))
+
+        self.layers = []
+        for depth in range(1, max_depth + 1):
+            if depth_nodes[depth]:
+                self.layers.append(self.buildLayer(genomes, depth_nodes[depth], incoming[depth], depth_ranges[depth]))
+
+    @staticmethod
+    def buildLayer(genomes: list, layer_nodes: list, incoming: list, depth_range: tuple) -> dict:
+        """
+        Builds the stacked connections, bias vector and activation groups of a
+        depth across all genomes, with connections sorted by target node.
+        :param genomes: list[Genome]
+        :param layer_nodes: list[tuple[int, int]]
+        :param incoming: list[tuple[int, int, int | float]]
+        :param depth_range: tuple[int, int]
+        :return:
+            - layer - dict[str: Any]
+        """
+        start, end = depth_range
+        incoming.sort(key=lambda connection: connection[0])
+        targets = np.array([connection[0] - start for connection in incoming], dtype=int)
+        segments = np.flatnonzero(np.diff(targets, prepend=-1)) if len(targets) else targets
+
+        activations = {}
+        for i, (genome_key, node_key) in enumerate(layer_nodes):
+            activation = genomes[genome_key].nodes[node_key].activation
+            if activation not in activations:
+                activations[activation] = []
+            activations[activation].append(i)
+
+        return {'start': start, 'end': end,
+                'sources': np.array([connection[1] for connection in incoming], dtype=int),
+                'weights': np.array([connection[2] for connection in incoming], dtype=float),
+                'targets': targets[segments], 'segments': segments,
+                'bias': np.array([genomes[genome_key].nodes[node_key].bias for genome_key, node_key in layer_nodes],
+                                 dtype=float),
+                'activations': [(ARRAY_ACTIVATIONS[activation], np.array(activations[activation]))
+                                for activation in activations]}
+
+    def forwardBatch(self, inputs: Any) -> ndarray:
+        """
+        Calculates the outputs of every genome for each row of the shared inputs.
+        :param inputs: list[list[int | float]] | ndarray
+        :return:
+            - outputs - ndarray
+        """
+        inputs = np.asarray(inputs, dtype=float).reshape(-1, self.inputs)
+        values = np.zeros((inputs.shape[0], self.total_nodes))
+        values[:, :self.size * self.inputs] = np.tile(inputs, self.size)
+
+        for layer in self.layers:
+            start, end = layer['start'], layer['end']
+            node_sums = np.zeros((inputs.shape[0], end - start))
+            if len(layer['segments']) and inputs.shape[0]:
+                node_sums[:, layer['targets']] = np.add.reduceat(values[:, layer['sources']] * layer['weights'],
+                                                                 layer['segments'], axis=1)
+            node_sums += layer['bias']
+
+            outputs = values[:, start:end]
+            for activation, node_indexes in layer['activations']:
+                outputs[:, node_indexes] = activation(node_sums[:, node_indexes])
+        return values[:, self.output_index].transpose(1, 0, 2)
+
+
+def connectionSaliencies(genome: Genome, positions: list, inputs: list) -> list:
+    """
+    Calculates the saliency of each given connection, the mean over the inputs
+    of the largest output change when the connection is removed. Every removal
+    is evaluated as a masked row of one batch.
+    :param genome: Genome
+    :param positions: list[tuple[int, int]]
+    :param inputs: list[list[int | float]]
+    :return:
+        - saliencies - list[float]
+    """
+    if np is None:
+        raise ImportError("connectionSaliencies requires NumPy")
+
+    plan = genome.plan if genome.plan is not None else genome.buildPlan()
+    masked_rows = {pos: row for row, pos in enumerate(positions, start=1)}
+
+    # Row 0 is the unmasked genome, every other row removes one connection
+    inputs = np.asarray(inputs, dtype=float).reshape(-1, genome.inputs)
+    values = np.zeros((inputs.shape[0], len(positions) + 1, genome.total_nodes))
+    values[:, :, :genome.inputs] = inputs[:, None, :]
+    for node_out, _, bias, nodes_in, weights in plan:
+        row_weights = np.tile(np.array(weights, dtype=float), (len(positions) + 1, 1))
+        for i, node_in in enumerate(nodes_in):
+            if (node_in, node_out) in masked_rows:
+                row_weights[masked_rows[(node_in, node_out)], i] = 0
+        node_sums = np.einsum('srk,rk->sr', values[:, :, list(nodes_in)], row_weights) + bias
+        values[:, :, node_out] = ARRAY_ACTIVATIONS[genome.nodes[node_out].activation](node_sums)
+
+    outputs = values[:, :, genome.inputs:genome.initial_nodes]
+    saliencies = np.abs(outputs[:, 1:] - outputs[:, :1]).max(axis=2).mean(axis=0)
+    return saliencies.tolist()
@@ -0,0 +1,494 @@
+from __future__ import annotations
+
+from array import array
+import random
+
+from .genome import GENOME_KEYS, Genome
+from .gene import Node, Connection
+from .innovation import InnovationRegistry
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__version__ = '1.4.0'
+__date__ = '17/10/2026'
+
+
+class NodeView(object):
+    """
+    NodeView is a Node compatible view of a node stored in a packed genome.
+    """
+    __slots__ = ('genome', 'key')
+
+    def __init__(self, genome: PackedGenome, key: int):
+        """
+        Initiates the NodeView object with the packed genome and node key.
+        :param genome: PackedGenome
+        :param key: int
+        """
+        self.genome = genome
+        self.key = key
+
+    @property
+    def layer_type(self) -> str:
+        return Genome.LAYER_TYPES[self.genome.node_types[self.key]]
+
+    @property
+    def activation(self) -> int:
+        return self.genome.node_activations[self.key]
+
+    @activation.setter
+    def activation(self, activation: int) -> None:
+        self.genome.node_activations[self.key] = activation
+
+    @property
+    def innovation(self) -> int:
+        return self.genome.node_innovations[self.key]
+
+    @property
+    def depth(self) -> int:
+        return self.genome.node_depths[self.key]
+
+    @property
+    def bias(self) -> float:
+        return self.genome.node_biases[self.key]
+
+    @bias.setter
+    def bias(self, bias: int | float) -> None:
+        self.genome.node_biases[self.key] = bias
+
+
+class ConnectionView(object):
+    """
+    ConnectionView is a Connection compatible view of a connection stored in
+    a packed genome.
+    """
+    __slots__ = ('genome', 'index')
+
+    def __init__(self, genome: PackedGenome, index: int):
+        """
+        Initiates the ConnectionView object with the packed genome and connection index.
+        :param genome: PackedGenome
+        :param index: int
+        """
+        self.genome = genome
+        self.index = index
+
+    @property
+    def weight(self) -> float:
+        return self.genome.connection_weights[self.index]
+
+    @weight.setter
+    def weight(self, weight: int | float) -> None:
+        self.genome.connection_weights[self.index] = weight
+
+    @property
+    def innovation(self) -> int:
+        return self.genome.connection_innovations[self.index]
+
+    @property
+    def active(self) -> bool:
+        return bool(self.genome.connection_actives[self.index])
+
+    @active.setter
+    def active(self, active: bool) -> None:
+        self.genome.connection_actives[self.index] = active
+
+
+class NodeMap(object):
+    """
+    NodeMap is a read only dict like view of the packed genome's nodes.
+    """
+    __slots__ = ('genome',)
+
+    def __init__(self, genome: PackedGenome):
+        self.genome = genome
+
+    def __getitem__(self, node_key: int) -> NodeView:
+        if not 0 <= node_key < len(self.genome.node_types):
+            raise KeyError(node_key)
+        return NodeView(self.genome, node_key)
+
+    def __iter__(self) -> Iterator:
+        return iter(range(len(self.genome.node_types)))
+
+    def __len__(self) -> int:
+        return len(self.genome.node_types)
+
+    def __contains__(self, node_key: int) -> bool:
+        return 0 <= node_key < len(self.genome.node_types)
+
+    def items(self) -> Iterator:
+        return ((node_key, NodeView(self.genome, node_key)) for node_key in self)
+
+
+class ConnectionMap(object):
+    """
+    ConnectionMap is a read only dict like view of the packed genome's
+    connections, keyed by (node_in, node_out).
+    """
+    __slots__ = ('genome', 'index')
+
+    def __init__(self, genome: PackedGenome):
+        self.genome = genome
+        self.index = None
+
+    def __getitem__(self, pos: tuple) -> ConnectionView:
+        if self.index is None:
+            self.index = {pos: i for i, pos in enumerate(self)}
+        return ConnectionView(self.genome, self.index[pos])
+
+    def __iter__(self) -> Iterator:
+        return zip(self.genome.connection_sources, self.genome.connection_targets)
+
+    def __len__(self) -> int:
+        return len(self.genome.connection_sources)
+
+    def __contains__(self, pos: tuple) -> bool:
+        if self.index is None:
+            self.index = {pos: i for i, pos in enumerate(self)}
+        return pos in self.index
+
+    def items(self) -> Iterator:
+        return ((pos, ConnectionView(self.genome, i)) for i, pos in enumerate(self))
+
+
+class PackedGenome(object):
+    """
+    PackedGenome is a compact storage mode of a genome, where the nodes and
+    connections are kept in parallel typed arrays. The genome's node and
+    connection counters are kept as well, as they can differ from the number
+    of genes.
+    """
+    __slots__ = ('inputs', 'outputs', 'node_info', 'activation', 'fitness', 'adjusted_fitness',
+                 'counted_nodes', 'counted_connections',
+                 'node_types', 'node_depths', 'node_biases', 'node_activations', 'node_innovations',
+                 'connection_sources', 'connection_targets', 'connection_weights', 'connection_actives',
+                 'connection_innovations')
+
+    def __init__(self, inputs: int, outputs: int, node_info: dict, activation: int = 0):
+        """
+        Initiates the PackedGenome object with empty arrays.
+        :param inputs: int
+        :param outputs: int
+        :param node_info: dict
+        :param activation: int
+        """
+        self.inputs = inputs
+        self.outputs = outputs
+        self.node_info = node_info
+        self.activation = activation
+        self.fitness = 0
+        self.adjusted_fitness = 0
+        self.counted_nodes = None
+        self.counted_connections = None
+
+        self.node_types = array('b')
+        self.node_depths = array('h')
+        self.node_biases = array('d')
+        self.node_activations = array('B')
+        self.node_innovations = array('q')
+
+        self.connection_sources = array('i')
+        self.connection_targets = array('i')
+        self.connection_weights = array('d')
+        self.connection_actives = array('b')
+        self.connection_innovations = array('q')
+
+    @classmethod
+    def pack(cls, genome: Genome) -> PackedGenome:
+        """
+        Packs the genome's nodes and connections into arrays.
+        :param genome: Genome
+        :return:
+            - packed_genome - PackedGenome
+        """
+        packed_genome = cls(genome.inputs, genome.outputs, genome.node_info, genome.activation)
+        packed_genome.fitness = genome.fitness
+        packed_genome.adjusted_fitness = genome.adjusted_fitness
+        packed_genome.counted_nodes = genome.total_nodes
+        packed_genome.counted_connections = genome.total_connections
+
+        for node_key in range(genome.total_nodes):
+            node = genome.nodes[node_key]
+            packed_genome.node_types.append(Genome.LAYER_TYPES.index(node.layer_type))
+            packed_genome.node_depths.append(node.depth)
+            packed_genome.node_biases.append(node.bias)
+            packed_genome.node_activations.append(node.activation)
+            packed_genome.node_innovations.append(node.innovation)
+
+        for pos in genome.connections:
+            connection = genome.connections[pos]
+            packed_genome.connection_sources.append(pos[0])
+            packed_genome.connection_targets.append(pos[1])
+            packed_genome.connection_weights.append(connection.weight)
+            packed_genome.connection_actives.append(connection.active)
+            packed_genome.connection_innovations.append(connection.innovation)
+        return packed_genome
+
+    def unpack(self, innovations: InnovationRegistry = None) -> Genome:
+        """
+        Unpacks the arrays into a new genome, the innovations are recorded in
+        a private registry when none is given.
+        :param innovations: InnovationRegistry | None
+        :return:
+            - genome - Genome
+        """
+        genome = Genome.__new__(Genome)
+        genome.key = next(GENOME_KEYS)
+        genome.inputs = self.inputs
+        genome.outputs = self.outputs
+        genome.node_info = self.node_info
+        genome.activations = self.node_info['activations']
+        genome.activation = self.activation
+        genome.initial_nodes = self.inputs + self.outputs
+        genome.total_nodes = self.total_nodes
+        genome.total_connections = self.total_connections
+        genome.max_depth = self.max_depth
+        genome.fitness = self.fitness
+        genome.adjusted_fitness = self.adjusted_fitness
+
+        genome.nodes = {}
+        for node_key in range(len(self.node_types)):
+            node = Node(Genome.LAYER_TYPES[self.node_types[node_key]], self.node_activations[node_key],
+                        self.node_innovations[node_key])
+            node.depth = self.node_depths[node_key]
+            node.bias = self.node_biases[node_key]
+            genome.nodes[node_key] = node
+
+        genome.connections = {}
+        for i, pos in enumerate(self.connections):
+            connection = Connection(self.connection_weights[i], self.connection_innovations[i])
+            connection.active = bool(self.connection_actives[i])
+            genome.connections[pos] = connection
+
+        if innovations is None:
+            innovations = InnovationRegistry(genome.initial_nodes)
+            innovations.register(genome)
+        genome.innovations = innovations
+        genome.buildIndex()
+        return genome
+
+    def copy(self) -> PackedGenome:
+        """
+        Copies the packed genome, only the arrays are copied.
+        :return:
+            - packed_genome - PackedGenome
+        """
+        packed_genome = PackedGenome.__new__(PackedGenome)
+        for attribute in self.__slots__:
+            value = getattr(self, attribute)
+            setattr(packed_genome, attribute, value[:] if isinstance(value, array) else value)
+        return packed_genome
+
+    def mutateWeights(self, rate: float, power: float = 1.0) -> None:
+        """
+        Adjusts a random portion of the connection weights at once.
+        :param rate: float
+        :param power: float
+        :return:
+            - None
+        """
+        if np is None:
+            for i in range(len(self.connection_weights)):
+                if random.random() < rate:
+                    self.connection_weights[i] += power * (2 * random.random() - 1)
+            return
+        weights = np.frombuffer(self.connection_weights, dtype=float)
+        mask = np.random.random(len(weights)) < rate
+        weights[mask] += power * (2 * np.random.random(np.count_nonzero(mask)) - 1)
+
+    @property
+    def initial_nodes(self) -> int:
+        return self.inputs + self.outputs
+
+    @property
+    def total_nodes(self) -> int:
+        return self.counted_nodes if self.counted_nodes is not None else len(self.node_types)
+
+    @property
+    def total_connections(self) -> int:
+        return self.counted_connections if self.counted_connections is not None else len(self.connection_sources)
+
+    @property
+    def max_depth(self) -> int:
+        return self.node_info['max_depth']
+
+    @property
+    def nodes(self) -> NodeMap:
+        return NodeMap(self)
+
+    @property
+    def connections(self) -> ConnectionMap:
+        return ConnectionMap(self)
+
+    def getNodeByType(self, layer_types: list = None) -> dict:
+        """
+        Sorts the nodes by layer type.
+        :param layer_types: list[str]
+        :return:
+            - node_types - dict[str: list[int]]
+        """
+        if layer_types is None:
+            layer_types = Genome.LAYER_TYPES
+        node_types = {node_type: [] for node_type in layer_types}
+        for node_key, layer_type in enumerate(self.node_types):
+            if Genome.LAYER_TYPES[layer_type] in node_types:
+                node_types[Genome.LAYER_TYPES[layer_type]].append(node_key)
+        return node_types
+
+    def getNodesByDepth(self) -> dict:
+        """
+        Sorts the nodes by node depth.
+        :return:
+            - node_depths - dict[int: list[int]]
+        """
+        node_depths = {i: [] for i in range(self.max_depth + 1)}
+        for node_key, depth in enumerate(self.node_depths):
+            node_depths[depth].append(node_key)
+        return node_depths
+
+    def getActiveConnections(self) -> list:
+        """
+        Gets the active connections.
+        :return:
+            - list[tuple[int, int]]
+        """
+        return [pos for pos, active in zip(self.connections, self.connection_actives) if active]
+
+
+class GenomeSnapshot(PackedGenome):
+    """
+    GenomeSnapshot is a frozen packed genome, the arrays are kept as tuples and
+    no attribute can be set once it is frozen. It is evaluated by a genome
+    unpacked on first use.
+    """
+    __slots__ = ('generation', 'source', 'genome')
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"GenomeSnapshot is frozen, '{name}' can not be set")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"GenomeSnapshot is frozen, '{name}' can not be deleted")
+
+    def __getstate__(self) -> dict:
+        """
+        Gets the snapshot's state for pickling, without the unpacked genome.
+        :return:
+            - state - dict[str: Any]
+        """
+        return {attribute: getattr(self, attribute) for attribute in PackedGenome.__slots__ + ('generation', 'source')}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Sets the snapshot's state when unpickling, snapshots of older models
+        have no counters.
+        :param state: dict[str: Any]
+        :return:
+            - None
+        """
+        object.__setattr__(self, 'counted_nodes', None)
+        object.__setattr__(self, 'counted_connections', None)
+        for attribute in state:
+            object.__setattr__(self, attribute, state[attribute])
+        object.__setattr__(self, 'genome', None)
+
+    @classmethod
+    def freeze(cls, genome: Genome, generation: int = 0) -> GenomeSnapshot:
+        """
+        Freezes the genome's current genes and fitness into a snapshot.
+        :param genome: Genome
+        :param generation: int
+        :return:
+            - snapshot - GenomeSnapshot
+        """
+        packed_genome = PackedGenome.pack(genome)
+        state = {attribute: getattr(packed_genome, attribute) for attribute in PackedGenome.__slots__}
+        state = {attribute: tuple(value) if isinstance(value, array) else value for attribute, value in state.items()}
+        state['generation'] = generation
+        state['source'] = (genome.key, genome.version)
+
+        snapshot = cls.__new__(cls)
+        snapshot.__setstate__(state)
+        return snapshot
+
+    def relabel(self, source: tuple) -> GenomeSnapshot:
+        """
+        Gets a snapshot of the same genes under another source, used to keep
+        snapshots of separate processes apart.
+        :param source: tuple
+        :return:
+            - snapshot - GenomeSnapshot
+        """
+        state = self.__getstate__()
+        state['source'] = source
+        snapshot = self.__class__.__new__(self.__class__)
+        snapshot.__setstate__(state)
+        return snapshot
+
+    def copy(self) -> GenomeSnapshot:
+        """
+        Snapshots are immutable, so the snapshot itself is returned.
+        :return:
+            - snapshot - GenomeSnapshot
+        """
+        return self
+
+    def getGenome(self) -> Genome:
+        """
+        Gets the genome unpacked from the snapshot, used for evaluation.
+        :return:
+            - genome - Genome
+        """
+        if self.genome is None:
+            object.__setattr__(self, 'genome', self.unpack())
+        return self.genome
+
+    @property
+    def plan(self) -> list:
+        return self.getGenome().plan
+
+    def buildPlan(self) -> list:
+        """
+        Builds the evaluation plan of the snapshot.
+        :return:
+            - plan - list[tuple]
+        """
+        return self.getGenome().buildPlan()
+
+    def forward(self, inputs: list) -> list:
+        """
+        Calculates the output sum using inputs, weights and bias.
+        :param inputs: list[float]
+        :return:
+            - outputs - list[float]
+        """
+        return self.getGenome().forward(inputs)
+
+    def forwardBatch(self, inputs: list) -> Any:
+        """
+        Calculates the outputs for a batch of input rows.
+        :param inputs: list[list[float]]
+        :return:
+            - outputs - np.ndarray | list[list[float]]
+        """
+        return self.getGenome().forwardBatch(inputs)
+
+    def getCompiled(self) -> Callable:
+        """
+        Gets the compiled forward function of the snapshot.
+        :return:
+            - forward - Callable
+        """
+        return self.getGenome().getCompiled()
+
+    def getNetwork(self, sparse: bool = None) -> LayeredNetwork:
+        """
+        Gets the layered network of the snapshot.
+        :param sparse: bool | None
+        :return:
+            - network - LayeredNetwork
+        """
+        return self.getGenome().getNetwork(sparse)
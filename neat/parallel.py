@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import concurrent.futures
+from itertools import repeat
+import os
+import time
+import weakref
+
+from .arena import GenomeArena, attachArena, decodeGenome
+from .distributed import Coordinator
+from .packed import PackedGenome
+
+__version__ = '1.4.2'
+__date__ = '17/10/2026'
+
+EXECUTORS = ['serial', 'thread', 'process', 'distributed']
+
+
+class SerialExecutor(concurrent.futures.Executor):
+    """
+    SerialExecutor runs each submitted call straight away in the calling
+    thread, used where pool overhead outweighs the work.
+    """
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        """
+        Runs the call and returns its completed future.
+        :param fn: Callable
+        :param args: Any
+        :param kwargs: Any
+        :return:
+            - future - concurrent.futures.Future
+        """
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def getWorkers(workers: int = 0) -> int:
+    """
+    Gets the number of workers, a non-positive number uses every core.
+    :param workers: int
+    :return:
+        - workers - int
+    """
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+def createExecutor(executor: str = 'thread', workers: int = 0, address: tuple = ('localhost', 6000),
+                   authkey: bytes = None) -> concurrent.futures.Executor:
+    """
+    Creates the executor backend by name, the distributed backend listens on
+    the address for workers.
+    :param executor: str
+    :param workers: int
+    :param address: tuple[str, int]
+    :param authkey: bytes | None
+    :return:
+        - executor - concurrent.futures.Executor
+    """
+    if executor == EXECUTORS[0]:
+        return SerialExecutor()
+    elif executor == EXECUTORS[1]:
+        return concurrent.futures.ThreadPoolExecutor(getWorkers(workers))
+    elif executor == EXECUTORS[2]:
+        return concurrent.futures.ProcessPoolExecutor(getWorkers(workers))
+    elif executor == EXECUTORS[3]:
+        return Coordinator(address, authkey)
+    raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
+
+
+def getChunkSize(total: int, executor: concurrent.futures.Executor) -> int:
+    """
+    Gets the number of calls sent to a process worker at once.
+    :param total: int
+    :param executor: concurrent.futures.Executor
+    :return:
+        - chunk_size - int
+    """
+    if not isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        return 1
+    return max(1, total // (executor._max_workers * 4))
+
+
+def mapResults(executor: concurrent.futures.Executor, evaluator: Callable, results: list, args: Any) -> list:
+    """
+    Calls evaluator(result, args) for each result with the executor.
+    :param executor: concurrent.futures.Executor
+    :param evaluator: Callable
+    :param results: list[Any]
+    :param args: Any
+    :return:
+        - fitnesses - list[int | float]
+    """
+    chunk_size = getChunkSize(len(results), executor)
+    return list(executor.map(evaluator, results, repeat(args), chunksize=chunk_size))
+
+
+def scheduleChunks(sizes: list, workers: int, chunk_size: int = 0) -> list:
+    """
+    Groups the tasks into chunks ordered longest first by their estimated
+    size. Adaptive chunks hold about an eighth of each worker's share of the
+    total size, so large tasks go alone and small tasks are grouped, otherwise
+    chunks hold a fixed number of tasks.
+    :param sizes: list[int | float]
+    :param workers: int
+    :param chunk_size: int
+    :return:
+        - chunks - list[list[int]]
+    """
+    order = sorted(range(len(sizes)), key=lambda task_key: sizes[task_key], reverse=True)
+    if chunk_size > 0:
+        return [order[i:i + chunk_size] for i in range(0, len(order), chunk_size)]
+
+    target = sum(sizes) / (workers * 8)
+    chunks, chunk, chunk_cost = [], [], 0
+    for task_key in order:
+        chunk.append(task_key)
+        chunk_cost += sizes[task_key]
+        if chunk_cost >= target:
+            chunks.append(chunk)
+            chunk, chunk_cost = [], 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def handleGenomes(handler: Callable, genomes: list, args: Any) -> tuple:
+    """
+    Passes each genome of the chunk to the handler and times the chunk.
+    :param handler: Callable
+    :param genomes: list[Genome]
+    :param args: Any
+    :return:
+        - results, seconds - tuple[list[Any], float]
+    """
+    start = time.perf_counter()
+    results = [handler(genome, args) for genome in genomes]
+    return results, time.perf_counter() - start
+
+
+def handlePackedGenomes(handler: Callable, packed_genomes: list, args: Any) -> tuple:
+    """
+    Unpacks each genome of the chunk in the worker, passes it to the handler
+    and times the chunk.
+    :param handler: Callable
+    :param packed_genomes: list[PackedGenome]
+    :param args: Any
+    :return:
+        - results, seconds - tuple[list[Any], float]
+    """
+    start = time.perf_counter()
+    results = [handler(packed_genome.unpack(), args) for packed_genome in packed_genomes]
+    return results, time.perf_counter() - start
+
+
+def evaluateResults(evaluator: Callable, results: list, args: Any) -> list:
+    """
+    Passes each result of the chunk to the evaluator.
+    :param evaluator: Callable
+    :param results: list[Any]
+    :param args: Any
+    :return:
+        - fitnesses - list[int | float]
+    """
+    return [evaluator(result, args) for result in results]
+
+
+def handleSlots(arena_name: str, offsets: list, node_info: dict, handler: Callable, args: Any) -> tuple:
+    """
+    Decodes the genomes at the offsets of the arena in the worker, passes
+    each to the handler and times the chunk.
+    :param arena_name: str
+    :param offsets: list[int]
+    :param node_info: dict
+    :param handler: Callable
+    :param args: Any
+    :return:
+        - results, seconds - tuple[list[Any], float]
+    """
+    start = time.perf_counter()
+    view = attachArena(arena_name)
+    results = [handler(decodeGenome(view, offset, node_info), args) for offset in offsets]
+    return results, time.perf_counter() - start
+
+
+def closePool(executor: concurrent.futures.Executor, arena: GenomeArena | None) -> None:
+    """
+    Shuts down the executor and releases the arena.
+    :param executor: concurrent.futures.Executor
+    :param arena: GenomeArena | None
+    :return:
+        - None
+    """
+    executor.shutdown(wait=True)
+    if arena is not None:
+        arena.close()
+
+
+class WorkerPool(object):
+    """
+    WorkerPool keeps an executor alive across generations. The process backend
+    shares the population through a genome arena, so tasks only carry offsets,
+    and the distributed backend sends packed genomes to the workers.
+    """
+    def __init__(self, executor: str = 'thread', workers: int = 0, chunk_size: int = 0,
+                 address: tuple = ('localhost', 6000), authkey: bytes = None):
+        """
+        Initiates the WorkerPool object, the pool is closed when it is garbage
+        collected or the interpreter exits, if not closed before.
+        :param executor: str
+        :param workers: int
+        :param chunk_size: int
+        :param address: tuple[str, int]
+        :param authkey: bytes | None
+        """
+        self.backend = executor
+        self.workers = getWorkers(workers)
+        self.chunk_size = chunk_size
+        self.timings = []
+        self.executor = createExecutor(executor, self.workers, address, authkey)
+        self.arena = GenomeArena() if executor == EXECUTORS[2] else None
+        self.finalizer = weakref.finalize(self, closePool, self.executor, self.arena)
+
+    def __enter__(self) -> WorkerPool:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return not self.finalizer.alive
+
+    def mapGenomes(self, handler: Callable, genomes: list, args: Any) -> list:
+        """
+        Calls handler(genome, args) for each genome in the pool. The genomes are
+        scheduled in chunks largest first and the results collected as the
+        chunks complete, the timing of each chunk is kept as
+        (genomes, size, seconds) in timings.
+        :param handler: Callable
+        :param genomes: list[Genome]
+        :param args: Any
+        :return:
+            - results - list[Any]
+        """
+        self.timings = []
+        if not genomes:
+            return []
+
+        sizes = [genome.total_nodes + genome.total_connections for genome in genomes]
+        chunks = scheduleChunks(sizes, self.workers, self.chunk_size)
+        futures = {}
+        if self.arena is not None:
+            offsets = self.arena.sync(genomes)
+            for chunk in chunks:
+                future = self.executor.submit(handleSlots, self.arena.name, [offsets[i] for i in chunk],
+                                              genomes[0].node_info, handler, args)
+                futures[future] = chunk
+        elif self.backend == EXECUTORS[3]:
+            for chunk in chunks:
+                packed_genomes = [PackedGenome.pack(genomes[i]) for i in chunk]
+                futures[self.executor.submit(handlePackedGenomes, handler, packed_genomes, args)] = chunk
+        else:
+            for chunk in chunks:
+                futures[self.executor.submit(handleGenomes, handler, [genomes[i] for i in chunk], args)] = chunk
+
+        results = [None] * len(genomes)
+        for future in concurrent.futures.as_completed(futures):
+            chunk = futures[future]
+            chunk_results, seconds = future.result()
+            for genome_key, result in zip(chunk, chunk_results):
+                results[genome_key] = result
+            self.timings.append((len(chunk), sum(sizes[i] for i in chunk), seconds))
+        return results
+
+    def submitGenome(self, handler: Callable, genome: Genome, args: Any) -> concurrent.futures.Future:
+        """
+        Submits handler(genome, args) for a single genome to the pool, process
+        and distributed workers are sent the packed genome as the arena is kept
+        for whole populations.
+        :param handler: Callable
+        :param genome: Genome
+        :param args: Any
+        :return:
+            - future - concurrent.futures.Future
+        """
+        if self.backend in EXECUTORS[2:]:
+            return self.executor.submit(handlePackedGenomes, handler, [PackedGenome.pack(genome)], args)
+        return self.executor.submit(handleGenomes, handler, [genome], args)
+
+    def mapResults(self, evaluator: Callable, results: list, args: Any) -> list:
+        """
+        Calls evaluator(result, args) for each result in the pool.
+        :param evaluator: Callable
+        :param results: list[Any]
+        :param args: Any
+        :return:
+            - fitnesses - list[int | float]
+        """
+        if self.backend != EXECUTORS[3]:
+            return mapResults(self.executor, evaluator, results, args)
+
+        chunks = scheduleChunks([1] * len(results), self.workers, self.chunk_size)
+        futures = [self.executor.submit(evaluateResults, evaluator, [results[i] for i in chunk], args)
+                   for chunk in chunks]
+        fitnesses = [None] * len(results)
+        for chunk, future in zip(chunks, futures):
+            for result_key, fitness in zip(chunk, future.result()):
+                fitnesses[result_key] = fitness
+        return fitnesses
+
+    def close(self) -> None:
+        """
+        Shuts down the executor and releases the arena.
+        :return:
+            - None
+        """
+        self.finalizer()
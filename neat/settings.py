@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from mattslib.file import read, write
 
-__version__ = '1.4.7'
-__date__ = '11/04/2022'
+__version__ = '1.4.18'
+__date__ = '17/10/2026'
 
 
 class Settings(object):
@@ -20,7 +20,18 @@ class Settings(object):
         """
         self.save_intervals = [1, 5, 10]
         self.save_model_interval = 100
+        self.save_format = 'binary'
+        self.log_snapshot_interval = 10
+        self.save_in_background = True
+        self.executor = 'thread'
+        self.workers = 0
+        self.chunk_size = 0
+        self.async_concurrency = 64
+        self.distributed_host = 'localhost'
+        self.distributed_port = 6000
+        self.distributed_authkey = ''
         self.delta_genome_threshold = 0.75
+        self.distance_cache_size = 100000
         self.distance_weights = {
             'activation': 0.1,
             'node': 0.5,
@@ -32,11 +43,13 @@ class Settings(object):
             'activations': ['tanh'],
             'max_depth': 5,
             'max_backtrack_depth': 1,
+            'pruning_samples': 1,
         }
 
         self.max_fitness = 0
         self.max_generations = 0
         self.max_fitness_history = 30
+        self.hall_of_fame_size = 10
 
         self.kill = 0.7
         self.remove_duplicate_interval = 50
@@ -65,6 +78,17 @@ class Settings(object):
         if environment_dir:
             self.load(environment_dir) if load else self.save(environment_dir)
 
+    def __setstate__(self, state: dict) -> None:
+        """
+        Sets the settings' state when unpickling, settings missing from older
+        models keep their default values.
+        :param state: dict[str: Any]
+        :return:
+            - None
+        """
+        self.__dict__.update(Settings('').__dict__)
+        self.__dict__.update(state)
+
     def load(self, environment_dir: str) -> None:
         """
         Loads the file and converts the json dict and updates
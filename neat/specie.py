@@ -1,45 +1,202 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from copy import deepcopy
 import math
 import random
 
 import neat
 from .genome import Genome
-from mattslib.dict import countOccurrence, sortIntoDict
+from .network import np
+from .packed import GenomeSnapshot
+from mattslib.dict import sortIntoDict
 from mattslib.math_util import mean, euclideanDistance, brayCurtisIndividualDistance
 
-__version__ = '1.4.11'
-__date__ = '27/04/2022'
+__version__ = '1.6.0'
+__date__ = '17/10/2026'
 
 
 def genomicDistance(x_member: Genome, y_member: Genome, distance_weights: dict) -> float:
     """
-    Calculates an estimated distance between two genomes using the Euclidean distance formular.
+    Calculates an estimated distance between two genomes using the Euclidean distance formular,
+    matching their genes by innovation.
     :param x_member: Genome
     :param y_member: Genome
     :param distance_weights: dict[str: float]
     :return:
         - distance - float
     """
+    return genomicDistances(x_member, [y_member], distance_weights)[0]
+
+
+def genomicDistances(x_member: Genome, y_members: list, distance_weights: dict) -> list:
+    """
+    Calculates the genomic distance between a genome and each of the given genomes,
+    by comparing their cached distance signatures in one pass.
+    :param x_member: Genome
+    :param y_members: list[Genome]
+    :param distance_weights: dict[str: float]
+    :return:
+        - distances - list[float]
+    """
+    if not y_members:
+        return []
+    x_signature = x_member.getSignature()
+    y_signatures = [y_member.getSignature() for y_member in y_members]
+
+    if np is None:
+        return [signatureDistance(x_signature, y_signature, distance_weights) for y_signature in y_signatures]
+
+    counts = np.array([y_signature[:2] for y_signature in y_signatures], dtype=float)
+    distances = distance_weights['node'] * np.abs(counts[:, 0] - x_signature[0])
+    distances += distance_weights['connection'] * np.abs(counts[:, 1] - x_signature[1])
+    distances += distance_weights['weight'] * np.sqrt(matchedSquares(x_signature[4], x_signature[5],
+                                                                     [y_signature[4] for y_signature in y_signatures],
+                                                                     [y_signature[5] for y_signature in y_signatures]))
+    distances += distance_weights['bias'] * np.sqrt(matchedSquares(x_signature[2], x_signature[3],
+                                                                   [y_signature[2] for y_signature in y_signatures],
+                                                                   [y_signature[3] for y_signature in y_signatures]))
+    return [round(distance, 7) for distance in distances.tolist()]
+
+
+def matchedSquares(x_innovations: Any, x_values: Any, y_innovations: list, y_values: list) -> Any:
+    """
+    Sums the squared differences of values with matching innovations, between
+    one set of genes and each of the others.
+    :param x_innovations: np.ndarray
+    :param x_values: np.ndarray
+    :param y_innovations: list[np.ndarray]
+    :param y_values: list[np.ndarray]
+    :return:
+        - sums - np.ndarray
+    """
+    total = len(y_innovations)
+    owners = np.repeat(np.arange(total), [len(innovations) for innovations in y_innovations])
+    y_innovations, y_values = np.concatenate(y_innovations), np.concatenate(y_values)
+    if not len(x_innovations) or not len(y_innovations):
+        return np.zeros(total)
+    indices = np.minimum(np.searchsorted(x_innovations, y_innovations), len(x_innovations) - 1)
+    differences = np.where(x_innovations[indices] == y_innovations, y_values - x_values[indices], 0.0)
+    return np.bincount(owners, differences ** 2, minlength=total)
+
+
+def signatureDistance(x_signature: tuple, y_signature: tuple, distance_weights: dict) -> float:
+    """
+    Calculates the genomic distance between two distance signatures, matching
+    their genes by innovation in a single merge pass.
+    :param x_signature: tuple[int, int, list[int], list[float], list[int], list[float]]
+    :param y_signature: tuple[int, int, list[int], list[float], list[int], list[float]]
+    :param distance_weights: dict[str: float]
+    :return:
+        - distance - float
+    """
     genomic_distance = 0.0
 
-    genomic_distance += distance_weights['node'] * euclideanDistance(x_member.total_nodes, y_member.total_nodes)
-    genomic_distance += distance_weights['connection'] * euclideanDistance(x_member.total_connections,
-                                                                           y_member.total_connections)
+    genomic_distance += distance_weights['node'] * euclideanDistance(x_signature[0], y_signature[0])
+    genomic_distance += distance_weights['connection'] * euclideanDistance(x_signature[1], y_signature[1])
 
-    counts = countOccurrence(list(x_member.connections) + list(y_member.connections))
-    matching_connections = [pos for pos in counts if counts[pos] == 2]
-    x_weight = [x_member.connections[pos].weight for pos in x_member.connections if pos in matching_connections]
-    y_weight = [y_member.connections[pos].weight for pos in y_member.connections if pos in matching_connections]
+    x_weight, y_weight = [], []
+    for x_key, y_key in matchGenes(x_signature[4], y_signature[4]):
+        x_weight.append(x_signature[5][x_key])
+        y_weight.append(y_signature[5][y_key])
     genomic_distance += distance_weights['weight'] * abs(euclideanDistance(x_weight, y_weight))
 
-    x_bias = [x_member.nodes[node_key].bias for node_key in x_member.nodes]
-    y_bias = [y_member.nodes[node_key].bias for node_key in y_member.nodes]
+    x_bias, y_bias = [], []
+    for x_key, y_key in matchGenes(x_signature[2], y_signature[2]):
+        x_bias.append(x_signature[3][x_key])
+        y_bias.append(y_signature[3][y_key])
     genomic_distance += distance_weights['bias'] * abs(euclideanDistance(x_bias, y_bias))
     return round(genomic_distance, 7)
 
 
+def matchGenes(x_innovations: list, y_innovations: list) -> list:
+    """
+    Matches the indices of genes with the same innovation, from innovations in sorted order.
+    :param x_innovations: list[int]
+    :param y_innovations: list[int]
+    :return:
+        - matching_indices - list[tuple[int, int]]
+    """
+    matching_indices = []
+    x_key, y_key = 0, 0
+    while x_key < len(x_innovations) and y_key < len(y_innovations):
+        if x_innovations[x_key] == y_innovations[y_key]:
+            matching_indices.append((x_key, y_key))
+            x_key += 1
+            y_key += 1
+        elif x_innovations[x_key] < y_innovations[y_key]:
+            x_key += 1
+        else:
+            y_key += 1
+    return matching_indices
+
+
+class DistanceCache(object):
+    """
+    Memoizes genomic distances between pairs of genomes, keyed by each genome's
+    key and version, and evicts the least recently used distances.
+    """
+    def __init__(self, size: int):
+        """
+        Initiates the DistanceCache object with the max number of distances.
+        :param size: int
+        """
+        self.size = size
+        self.distances = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def getDistances(self, x_member: Genome, y_members: list, distance_weights: dict) -> list:
+        """
+        Gets the genomic distance between a genome and each of the given genomes,
+        only the distances not in the cache are calculated.
+        :param x_member: Genome
+        :param y_members: list[Genome]
+        :param distance_weights: dict[str: float]
+        :return:
+            - distances - list[float]
+        """
+        if self.size <= 0:
+            return genomicDistances(x_member, y_members, distance_weights)
+
+        x_key = (x_member.key, x_member.version)
+        distances, missing = [], {}
+        for member_key, y_member in enumerate(y_members):
+            y_key = (y_member.key, y_member.version)
+            pair = (x_key, y_key) if x_key <= y_key else (y_key, x_key)
+            if pair in self.distances:
+                self.distances.move_to_end(pair)
+                distances.append(self.distances[pair])
+                self.hits += 1
+            else:
+                missing[member_key] = pair
+                distances.append(None)
+                self.misses += 1
+
+        if missing:
+            calculated = genomicDistances(x_member, [y_members[member_key] for member_key in missing],
+                                          distance_weights)
+            for (member_key, pair), distance in zip(missing.items(), calculated):
+                distances[member_key] = distance
+                self.distances[pair] = distance
+            while len(self.distances) > self.size:
+                self.distances.popitem(last=False)
+        return distances
+
+    def clear(self) -> None:
+        """
+        Clears the cached distances and counters.
+        :return:
+            - None
+        """
+        self.distances.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class Specie(object):
     """
     Divides the population into manageable species based on the calculated genomic distance.
@@ -78,18 +235,20 @@ class Specie(object):
         if len(self.fitness_history) > self.settings.max_fitness_history:
             self.fitness_history.pop(0)
 
-    def killGenomes(self, remove_duplicate: bool = False, elitism: bool = False) -> None:
+    def killGenomes(self, remove_duplicate: bool = False, elitism: bool = False,
+                    distance_cache: DistanceCache = None) -> None:
         """
         Kills duplicate genomes and a portion of inferior genomes.
         :param remove_duplicate: bool
         :param elitism: bool
+        :param distance_cache: DistanceCache | None
         :return:
             - None
         """
         max_survive = int(math.ceil((1 - self.settings.kill) * len(self.members))) if not elitism else 1
 
         if remove_duplicate:
-            distances = self.getDistances()
+            distances = self.getDistances(distance_cache)
             duplicate_genomes = []
 
             for genome_key, distance in enumerate(distances):
@@ -125,19 +284,19 @@ class Specie(object):
             if member.adjusted_fitness > self.representative.adjusted_fitness:
                 self.representative = member
 
-    def getDistances(self) -> list:
+    def getDistances(self, distance_cache: DistanceCache = None) -> list:
         """
         Gets the genomic distance for each member in respects to the representative.
+        :param distance_cache: DistanceCache | None
         :return:
             - distances - list[float]
         """
-        distances = []
-        for member in self.members:
-            distance = 0
-            if member != self.representative:
-                distance = genomicDistance(member, self.representative, self.settings.distance_weights)
-            distances.append(distance)
-        return distances
+        if distance_cache is not None:
+            distances = distance_cache.getDistances(self.representative, self.members, self.settings.distance_weights)
+        else:
+            distances = genomicDistances(self.representative, self.members, self.settings.distance_weights)
+        return [0 if member == self.representative else distance
+                for member, distance in zip(self.members, distances)]
 
     def shouldSurvive(self) -> bool:
         """
@@ -151,6 +310,15 @@ class Specie(object):
             return True
         return False
 
+    def snapshot(self, generation: int = 0) -> SpecieSnapshot:
+        """
+        Snapshots the specie's fitness and representative.
+        :param generation: int
+        :return:
+            - snapshot - SpecieSnapshot
+        """
+        return SpecieSnapshot(self, generation)
+
     def getAllFitnesses(self) -> list:
         """
         Gets the adjusted fitness of each member in specie.
@@ -158,3 +326,105 @@ class Specie(object):
             - fitnesses - list[int | float]
         """
         return [member.adjusted_fitness for member in self.members]
+
+
+class SpecieSnapshot(object):
+    """
+    SpecieSnapshot is a frozen record of a specie's fitness history and
+    representative, kept instead of copying the whole specie.
+    """
+    __slots__ = ('fitness_history', 'fitness_mean', 'representative', 'generation')
+
+    def __init__(self, specie: Specie, generation: int = 0):
+        """
+        Initiates the SpecieSnapshot object from the specie.
+        :param specie: Specie
+        :param generation: int
+        """
+        self.fitness_history = tuple(specie.fitness_history)
+        self.fitness_mean = specie.fitness_mean
+        self.representative = GenomeSnapshot.freeze(specie.representative, generation)
+        self.generation = generation
+
+    @property
+    def members(self) -> list:
+        return [self.representative]
+
+
+class SpeciesIndex(object):
+    """
+    Indexes the species representatives into buckets by node count, the node and
+    connection count terms of the genomic distance are used as a lower bound to
+    prune species before the full distance is calculated.
+    """
+    def __init__(self, settings: Settings, species: list = None, distance_cache: DistanceCache = None):
+        """
+        Initiates the SpeciesIndex object with the given species.
+        :param settings: Settings
+        :param species: list[Specie] | None
+        :param distance_cache: DistanceCache | None
+        """
+        self.settings = settings
+        self.distance_cache = distance_cache
+        self.buckets = {}
+        self.total_species = 0
+
+        for specie in species if species is not None else []:
+            self.add(specie)
+
+    def add(self, specie: Specie) -> None:
+        """
+        Adds the specie into the bucket of its representative's node count.
+        :param specie: Specie
+        :return:
+            - None
+        """
+        node_count = specie.representative.total_nodes
+        self.buckets.setdefault(node_count, []).append((self.total_species, specie))
+        self.total_species += 1
+
+    def getCandidates(self, genome: Genome) -> list:
+        """
+        Gets the species which lower bound distance to the genome is within the
+        threshold, in the order they were added.
+        :param genome: Genome
+        :return:
+            - candidates - list[Specie]
+        """
+        distance_weights = self.settings.distance_weights
+        threshold = self.settings.delta_genome_threshold
+
+        node_counts = list(self.buckets)
+        if distance_weights['node'] > 0:
+            span = int(threshold / distance_weights['node']) + 1
+            if 2 * span + 1 < len(node_counts):
+                node_counts = range(genome.total_nodes - span, genome.total_nodes + span + 1)
+
+        candidates = []
+        for node_count in node_counts:
+            for order, specie in self.buckets.get(node_count, []):
+                representative = specie.representative
+                bound = distance_weights['node'] * abs(representative.total_nodes - genome.total_nodes)
+                bound += distance_weights['connection'] * abs(representative.total_connections -
+                                                              genome.total_connections)
+                if round(bound, 7) <= threshold:
+                    candidates.append((order, specie))
+        return [specie for _, specie in sorted(candidates, key=lambda candidate: candidate[0])]
+
+    def classify(self, genome: Genome) -> Specie | None:
+        """
+        Finds the first indexed specie within the genomic distance threshold.
+        :param genome: Genome
+        :return:
+            - specie - Specie | None
+        """
+        candidates = self.getCandidates(genome)
+        representatives = [specie.representative for specie in candidates]
+        if self.distance_cache is not None:
+            distances = self.distance_cache.getDistances(genome, representatives, self.settings.distance_weights)
+        else:
+            distances = genomicDistances(genome, representatives, self.settings.distance_weights)
+        for specie, distance in zip(candidates, distances):
+            if distance <= self.settings.delta_genome_threshold:
+                return specie
+        return None
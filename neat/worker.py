@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import argparse
+from multiprocessing.connection import Client
+
+__version__ = '1.1.0'
+__date__ = '17/10/2026'
+
+
+def work(address: tuple, authkey: bytes) -> int:
+    """
+    Connects to the coordinator and runs the calls it sends until it tells
+    the worker to stop or the connection is lost.
+    :param address: tuple[str, int]
+    :param authkey: bytes
+    :return:
+        - calls - int
+    """
+    calls = 0
+    with Client(tuple(address), authkey=authkey) as connection:
+        while True:
+            try:
+                task = connection.recv()
+            except (OSError, EOFError):
+                return calls
+            except Exception as e:
+                # The call could not be unpickled, such as a handler defined in the coordinator's __main__
+                result = (False, e)
+            else:
+                if task is None:
+                    return calls
+                fn, args, kwargs = task
+                try:
+                    result = (True, fn(*args, **kwargs))
+                except Exception as e:
+                    result = (False, e)
+            try:
+                connection.send(result)
+            except Exception as e:
+                # The result or error could not be pickled
+                connection.send((False, RuntimeError(repr(e))))
+            calls += 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Runs a NEAT evaluation worker for a coordinator.")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=6000)
+    parser.add_argument('--authkey', required=True)
+    arguments = parser.parse_args()
+    work((arguments.host, arguments.port), arguments.authkey.encode())
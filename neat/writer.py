@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import atexit
+import threading
+
+__version__ = '1.0.1'
+__date__ = '17/10/2026'
+
+
+class CheckpointWriter(object):
+    """
+    CheckpointWriter saves snapshots from a background thread, so training
+    does not wait on serialization or disk. Saves queued for the same target
+    are coalesced and only the latest is written, unless they append to it,
+    an error raised by a save is raised to the caller on the next submit or
+    flush.
+    """
+    def __init__(self):
+        """
+        Initiates the CheckpointWriter object and starts its thread, pending
+        saves are flushed when the interpreter exits, if not closed before.
+        """
+        self.condition = threading.Condition()
+        self.pending = {}
+        self.errors = []
+        self.writing = False
+        self.closed = False
+        self.written = 0
+        self.coalesced = 0
+        self.appends = 0
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> CheckpointWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def submit(self, target: str, save: Callable, *args: Any, coalesce: bool = True) -> None:
+        """
+        Queues save(*args) for the target, replacing a save of the target
+        which has not started yet. Saves which are not coalesced, such as
+        appends, are all written in the order they were queued.
+        :param target: str
+        :param save: Callable
+        :param args: Any
+        :param coalesce: bool
+        :return:
+            - None
+        """
+        self.raiseErrors()
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("Can not submit saves after the writer has closed")
+            if not coalesce:
+                target = (target, self.appends)
+                self.appends += 1
+            elif self.pending.pop(target, None) is not None:
+                self.coalesced += 1
+            self.pending[target] = (save, args)
+            self.condition.notify_all()
+
+    def run(self) -> None:
+        """
+        Writes the queued saves in the order they were queued until the
+        writer is closed.
+        :return:
+            - None
+        """
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                target = next(iter(self.pending))
+                save, args = self.pending.pop(target)
+                self.writing = True
+
+            error = None
+            try:
+                save(*args)
+            except Exception as e:
+                error = e
+            with self.condition:
+                if error is not None:
+                    self.errors.append(error)
+                else:
+                    self.written += 1
+                self.writing = False
+                self.condition.notify_all()
+
+    def raiseErrors(self) -> None:
+        """
+        Raises the first error of the saves since the last call.
+        :return:
+            - None
+        """
+        with self.condition:
+            errors, self.errors = self.errors, []
+        if errors:
+            raise errors[0]
+
+    def flush(self) -> None:
+        """
+        Waits until every queued save is written.
+        :return:
+            - None
+        """
+        with self.condition:
+            while self.pending or self.writing:
+                self.condition.wait()
+        self.raiseErrors()
+
+    def close(self) -> None:
+        """
+        Writes the queued saves and stops the thread.
+        :return:
+            - None
+        """
+        with self.condition:
+            if self.closed:
+                return
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+        atexit.unregister(self.close)
+        self.raiseErrors()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import unittest
+
+from neat import NEAT
+
+__version__ = '1.0.0'
+__date__ = '17/10/2026'
+
+INPUTS = [1.0, 0.0]
+
+
+class StubServer(object):
+    """
+    StubServer scores the outputs sent to it after a delay, keeping the peak
+    number of requests it served at once.
+    """
+    def __init__(self, delay: float = 0.01):
+        """
+        Initiates the StubServer object.
+        :param delay: float
+        """
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+        self.server = None
+
+    async def start(self) -> tuple:
+        """
+        Starts serving on a free port of localhost.
+        :return:
+            - address - tuple[str, int]
+        """
+        self.server = await asyncio.start_server(self.serve, 'localhost', 0)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Replies to a request with the output as fitness.
+        :param reader: asyncio.StreamReader
+        :param writer: asyncio.StreamWriter
+        :return:
+            - None
+        """
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        output = float((await reader.readline()).decode())
+        await asyncio.sleep(self.delay)
+        writer.write(f"{output!r}\n".encode())
+        await writer.drain()
+        writer.close()
+        self.active -= 1
+        self.requests += 1
+
+    async def close(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+
+async def requestFitness(genome: Genome, args: tuple) -> float:
+    """
+    Sends the genome's output to the stub server and awaits its fitness.
+    :param genome: Genome
+    :param args: tuple[tuple[str, int]]
+    :return:
+        - fitness - float
+    """
+    reader, writer = await asyncio.open_connection(*args[0])
+    writer.write(f"{genome.forward(INPUTS)[0]!r}\n".encode())
+    await writer.drain()
+    fitness = float((await reader.readline()).decode())
+    writer.close()
+    await writer.wait_closed()
+    return fitness
+
+
+class TestAsync(unittest.TestCase):
+    """
+    Evaluates a population against a local stub server.
+    """
+    def test_evaluate_async(self) -> None:
+        random.seed(0)
+        neat = NEAT('')
+        neat.settings.async_concurrency = 4
+        neat.generate(2, 1, population=40)
+        members = [member for specie in neat.species for member in specie.members]
+        for member in members:
+            member.fitness = None
+
+        async def evaluate() -> StubServer:
+            server = StubServer()
+            address = await server.start()
+            try:
+                await neat.evaluateAsync(requestFitness, address, evolve=False)
+            finally:
+                await server.close()
+            return server
+
+        server = asyncio.run(evaluate())
+        self.assertEqual(server.requests, len(members))
+        self.assertEqual([member.fitness for member in members], [member.forward(INPUTS)[0] for member in members])
+        self.assertLessEqual(server.peak, neat.settings.async_concurrency)
+        self.assertGreater(server.peak, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
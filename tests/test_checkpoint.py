@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import unittest
+
+from neat import NEAT
+from neat.checkpoint import SECRET_SETTINGS, isCheckpoint
+from neat.packed import PackedGenome
+
+__version__ = '1.0.0'
+__date__ = '17/10/2026'
+
+ROWS = [(0, 0), (0, 1), (1, 0), (1, 1)]
+AUTHKEY = 'SUPERSECRET'
+
+
+def xorOutputs(genome: Genome, args: tuple) -> list:
+    """
+    Gets the genome's output for each row of the XOR table.
+    :param genome: Genome
+    :param args: tuple
+    :return:
+        - outputs - list[float]
+    """
+    return [genome.forward(list(row))[0] for row in ROWS]
+
+
+def xorFitness(outputs: list, args: tuple) -> int:
+    """
+    Scores the genome's outputs against the XOR table.
+    :param outputs: list[float]
+    :param args: tuple
+    :return:
+        - fitness - int
+    """
+    return round(100 * (4 - sum(abs((a ^ b) - output) for (a, b), output in zip(ROWS, outputs))))
+
+
+def getGenes(genome: Genome | PackedGenome) -> list:
+    """
+    Gets the genome's packed genes and counters as lists.
+    :param genome: Genome | PackedGenome
+    :return:
+        - genes - list[Any]
+    """
+    packed_genome = genome if isinstance(genome, PackedGenome) else PackedGenome.pack(genome)
+    return [list(value) if not isinstance(value, (int, float, dict, type(None))) else value
+            for value in (getattr(packed_genome, attribute) for attribute in PackedGenome.__slots__)]
+
+
+def describe(neat: NEAT) -> list:
+    """
+    Describes the NEAT's settings, innovations, species, members, hall of
+    fame and best specie, to compare a loaded model against the model saved.
+    :param neat: NEAT
+    :return:
+        - description - list[Any]
+    """
+    description = [neat.generation, neat.population, neat.inputs, neat.outputs, neat.current_species,
+                   {name: value for name, value in neat.settings.__dict__.items() if name not in SECRET_SETTINGS},
+                   neat.innovations.node_innovation, neat.innovations.connection_innovation,
+                   sorted(neat.innovations.nodes.items()), sorted(neat.innovations.connections.items())]
+    for specie in neat.species:
+        description.append((list(specie.fitness_history), specie.fitness_mean,
+                            specie.members.index(specie.representative)))
+        for member in specie.members:
+            description.append((member.fitness, member.adjusted_fitness, getGenes(member),
+                                [list(value) if not isinstance(value, int) else value
+                                 for value in member.getSignature()]))
+    for entry in neat.hall_of_fame:
+        description.append((entry.generation, entry.source, getGenes(entry)))
+    best_specie = neat.best_specie
+    description.append((list(best_specie.fitness_history), best_specie.fitness_mean, best_specie.generation,
+                        getGenes(best_specie.representative)))
+    return description
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    Saves evolved models as binary checkpoints and loads them back.
+    """
+    def setUp(self) -> None:
+        random.seed(0)
+        self.directory = tempfile.TemporaryDirectory()
+        self.neat = NEAT('')
+        self.neat.file_dir = self.directory.name + os.sep
+        self.neat.file_name = 'checkpoint'
+        self.neat.settings.executor = 'serial'
+        self.neat.settings.save_in_background = False
+        self.neat.settings.distributed_authkey = AUTHKEY
+        self.neat.generate(2, 1, population=100)
+
+    def tearDown(self) -> None:
+        self.neat.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        for _ in range(6):
+            self.neat.parallelEvolve(xorFitness, self.neat.parallelTest(xorOutputs))
+        self.neat.save()
+
+        file_dir = self.neat.file_dir + self.neat.file_name
+        self.assertTrue(isCheckpoint(file_dir + '.neat'))
+        loaded = NEAT.load(file_dir)
+        self.assertEqual(describe(loaded), describe(self.neat))
+        self.assertEqual(loaded.settings.distributed_authkey, '')
+        with open(file_dir + '.neat', 'rb') as file:
+            self.assertNotIn(AUTHKEY.encode(), file.read())
+
+        loaded.parallelEvolve(xorFitness, loaded.parallelTest(xorOutputs))
+        self.assertEqual(loaded.generation, self.neat.generation + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
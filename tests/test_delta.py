@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import unittest
+
+from neat import NEAT
+from neat.delta import getGenerations
+from tests.test_checkpoint import AUTHKEY, describe, xorFitness, xorOutputs
+
+__version__ = '1.0.0'
+__date__ = '17/10/2026'
+
+
+class TestDelta(unittest.TestCase):
+    """
+    Appends every generation to a delta log and loads each of them back.
+    """
+    def setUp(self) -> None:
+        random.seed(0)
+        self.directory = tempfile.TemporaryDirectory()
+        self.neat = NEAT('')
+        self.neat.file_dir = self.directory.name + os.sep
+        self.neat.file_name = 'log'
+        self.neat.settings.executor = 'serial'
+        self.neat.settings.save_format = 'log'
+        self.neat.settings.log_snapshot_interval = 3
+        self.neat.settings.distributed_authkey = AUTHKEY
+        self.neat.generate(2, 1, population=100)
+
+    def tearDown(self) -> None:
+        self.neat.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        self.neat.save()
+        descriptions = {self.neat.generation: describe(self.neat)}
+        random_states = {self.neat.generation: random.getstate()}
+        for _ in range(7):
+            self.neat.parallelEvolve(xorFitness, self.neat.parallelTest(xorOutputs))
+            descriptions[self.neat.generation] = describe(self.neat)
+            random_states[self.neat.generation] = random.getstate()
+        self.neat.flush()
+
+        file_dir = self.neat.file_dir + self.neat.file_name
+        self.assertEqual(getGenerations(file_dir + '.neatlog'), sorted(descriptions))
+        for generation in descriptions:
+            loaded = NEAT.load(file_dir, generation)
+            self.assertEqual(describe(loaded), descriptions[generation])
+            self.assertEqual(random.getstate(), random_states[generation])
+            self.assertEqual(loaded.settings.distributed_authkey, '')
+        with open(file_dir + '.neatlog', 'rb') as file:
+            self.assertNotIn(AUTHKEY.encode(), file.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import unittest
+
+from neat import NEAT
+from neat.distributed import Coordinator
+
+__version__ = '1.0.0'
+__date__ = '17/10/2026'
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROWS = [[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]]
+
+
+def slowOutputs(genome: Genome, args: tuple) -> list:
+    """
+    Gets the genome's outputs for each row after a delay, so a worker can be
+    killed while calls are in progress.
+    :param genome: Genome
+    :param args: tuple[float]
+    :return:
+        - outputs - list[list[float]]
+    """
+    time.sleep(args[0])
+    return [genome.forward(row) for row in ROWS]
+
+
+def hiddenOutputs(genome: Genome, args: tuple) -> list:
+    """
+    Gets the genome's outputs, the workers can not unpickle it as it is
+    looked up in their __main__.
+    :param genome: Genome
+    :param args: tuple
+    :return:
+        - outputs - list[list[float]]
+    """
+    return [genome.forward(row) for row in ROWS]
+
+
+class TestDistributed(unittest.TestCase):
+    """
+    Runs a coordinator with worker processes on localhost.
+    """
+    WORKERS = 3
+
+    def setUp(self) -> None:
+        random.seed(0)
+        self.neat = NEAT('')
+        self.neat.settings.executor = 'serial'
+        self.neat.generate(2, 1, population=60)
+        self.expected = self.neat.parallelTest(slowOutputs, 0.0)
+        self.workers = []
+
+    def tearDown(self) -> None:
+        self.neat.close()
+        for worker in self.workers:
+            try:
+                worker.wait(10)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+                worker.wait()
+
+    def startWorkers(self) -> Coordinator:
+        """
+        Starts the coordinator on a free port and the workers, waiting until
+        each has connected.
+        :return:
+            - coordinator - Coordinator
+        """
+        self.neat.settings.executor = 'distributed'
+        self.neat.settings.distributed_host, self.neat.settings.distributed_port = 'localhost', 0
+        self.neat.settings.workers = self.WORKERS
+        coordinator = self.neat.getPool().executor
+
+        environment = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT_DIR, os.environ.get('PYTHONPATH', '')]))
+        for _ in range(self.WORKERS):
+            self.workers.append(subprocess.Popen(
+                [sys.executable, '-m', 'neat.worker', '--port', str(coordinator.address[1]),
+                 '--authkey', coordinator.authkey.decode()],
+                cwd=ROOT_DIR, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+
+        deadline = time.time() + 30
+        while coordinator.total_workers < self.WORKERS:
+            self.assertLess(time.time(), deadline, "The workers did not connect")
+            time.sleep(0.05)
+        return coordinator
+
+    def test_lost_worker(self) -> None:
+        coordinator = self.startWorkers()
+        killer = threading.Timer(0.3, self.workers[0].kill)
+        killer.start()
+        results = self.neat.parallelTest(slowOutputs, 0.05)
+        killer.join()
+
+        self.assertIsNotNone(self.workers[0].poll())
+        self.assertEqual(coordinator.total_workers, self.WORKERS - 1)
+        self.assertEqual(results, self.expected)
+
+    def test_unpicklable_handler(self) -> None:
+        coordinator = self.startWorkers()
+        hiddenOutputs.__module__ = '__main__'
+        setattr(sys.modules['__main__'], hiddenOutputs.__name__, hiddenOutputs)
+        try:
+            with self.assertRaises(AttributeError):
+                self.neat.parallelTest(hiddenOutputs)
+        finally:
+            hiddenOutputs.__module__ = __name__
+            delattr(sys.modules['__main__'], hiddenOutputs.__name__)
+
+        self.assertEqual(coordinator.total_workers, self.WORKERS)
+        self.assertEqual(self.neat.parallelTest(slowOutputs, 0.0), self.expected)
+
+    def test_authkey(self) -> None:
+        with self.assertRaises(ValueError):
+            Coordinator(('0.0.0.0', 0))
+        with self.assertRaises(ValueError):
+            Coordinator(('0.0.0.0', 0), b'neat')
+
+        coordinator = Coordinator(('localhost', 0))
+        self.assertGreaterEqual(len(coordinator.authkey), 32)
+        coordinator.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()